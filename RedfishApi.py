@@ -1,21 +1,118 @@
+import asyncio
+import json
 import logging
+from collections.abc import Awaitable, Callable
+from urllib.parse import urlparse
 
-import redfish
-from redfish.rest.v1 import HttpClient
+import aiohttp
+from redfish.rest.v1 import (
+    InvalidCredentialsError,
+    RetriesExhaustedError,
+    SessionCreationError,
+)
 
-from .const import ChassisConsumptions, ChassisFans, ChassisGenThermal, ChassisPSU, General, ManagersGeneral, SetPowerStatus, SystemSpecific, SystemsGeneral
+from .const import FANS, MAX_CONCURRENT_REQUESTS, PSU, RESOURCE_CACHE_MAX_ENTRIES, RESOURCE_CACHE_TTL, TEMPERATURE, USER_AGENT, WATTSENSOR, ChassisConsumptions, ChassisFans, ChassisGenThermal, ChassisPower, ChassisPSU, EventSubscriptions, General, ManagersGeneral, SessionsGeneral, SetPowerStatus, SystemSpecific, SystemsGeneral
+from .resource_cache import ResourceCache
 
 _LOGGER = logging.getLogger(__name__)
 
+# fields a Thermal array entry must carry to be used without following its link
+THERMAL_FAN_FIELDS = ("Reading",)
+THERMAL_TEMPERATURE_FIELDS = ("Name", "ReadingCelsius")
+# same for the Power arrays
+POWER_PSU_FIELDS = ("LineInputVoltage",)
+POWER_CONTROL_FIELDS = ("PowerConsumedWatts",)
+
+# properties actually read from each polled resource, sent as $select when supported
+SYSTEM_SELECT = ("PowerState", "Status", "HostName", "Model", "Manufacturer", "BiosVersion", "Actions", "Links")
+THERMAL_SELECT = ("Fans", "Temperatures")
+POWER_SELECT = ("PowerSupplies", "PowerControl")
+
+# statuses of a resource the firmware does not implement
+UNSUPPORTED_STATUSES = (404, 405)
+
+# query options the service root advertises in ProtocolFeaturesSupported, none until probed
+# "rejected" is sticky: the firmware answered 400 to the options it advertises
+NO_CAPABILITIES = {"expand": False, "select": False, "rejected": False}
+
+
+class RedfishHttpError(Exception):
+    """Error status of a read whose body would otherwise be parsed as the resource.
+
+    Carries the HTTP status, ApiRequestManager retries the transient ones (RETRY_STATUSES).
+    """
+
+    def __init__(self, status: int, method: str, path: str, ip: str) -> None:
+        super().__init__(f"HTTP {status}: {method} {path} on {ip}")
+        self.status : int = status
+
+
+class RedfishResponse:
+    """Parsed Redfish response, mirroring the redfish library RestResponse surface."""
+
+    __slots__ = ("status", "dict", "headers", "size")
+
+    def __init__(self, status: int, body: dict, headers, size: int = 0) -> None:
+        self.status : int = status
+        self.dict : dict = body
+        self.headers = headers
+        # bytes of the raw body
+        self.size : int = size
+
 
 class RedfishApihub:
-    def __init__(self, ip: str, user: str, password: str) -> None:
+    def __init__(self, ip: str, user: str, password: str, session: aiohttp.ClientSession, inline_first: bool = True, max_concurrent: int = MAX_CONCURRENT_REQUESTS) -> None:
         self.ip : str = ip
         self.user : str = user
         self.password : str = password
 
-        self.logget : HttpClient = None
-        # self.logget = self.singleton_login()
+        # shared aiohttp session (owned by Home Assistant), one X-Auth-Token per hub
+        self.session : aiohttp.ClientSession = session
+        self.base_url : str = "https://" + ip
+        self.auth_token : str | None = None
+        self.session_location : str | None = None
+
+        # awaited after every new session, the lease records its location
+        self.onSessionCreated : Callable[[], Awaitable[None]] | None = None
+
+        self.max_retry : int = 3
+        self.timeout = aiohttp.ClientTimeout(total=10)
+
+        # cap of requests in flight against this iDRAC
+        self._requestSemaphore = asyncio.Semaphore(max(1, int(max_concurrent)))
+
+        # serializes every change of the session (login, re-login, logout)
+        self._loginLock = asyncio.Lock()
+
+        # build readings from inline Thermal/Power arrays, follow member links only when needed
+        self.inline_first : bool = inline_first
+
+        # $expand/$select support, probed from the service root by getServiceTag
+        self.capabilities : dict[str, bool] = dict(NO_CAPABILITIES)
+        # called once the firmware rejected them, so the owner can persist the flag
+        self.onCapabilitiesRejected : Callable[[], None] | None = None
+
+        # request counters, exposed through diagnostics
+        self.stats : dict[str, int] = {
+            "requests": 0,
+            "logins": 0,
+            "relogins": 0,
+            "session_checks_saved": 0,
+            "coalesced": 0,
+            "stale_sessions_removed": 0,
+            "sessions_resumed": 0,
+            "logins_shared": 0,
+        }
+
+        # key -> task of a GET in flight, shared by every identical concurrent caller
+        self._inflight : dict[tuple, asyncio.Future] = {}
+
+        # parsed resources by class (root, collection, system, inventory), see RESOURCE_CACHE_TTL
+        self.cache = ResourceCache(RESOURCE_CACHE_MAX_ENTRIES, RESOURCE_CACHE_TTL)
+
+        # path -> (ETag, projection, body size) of the conditional GETs, and their per path counters
+        self._etagCache : dict[str, tuple[str, any, int]] = {}
+        self.etagStats : dict[str, dict[str, int]] = {}
 
         self.MembersCount : int = 0
         self.lsEmmeddedSystem = []
@@ -32,79 +129,288 @@ class RedfishApihub:
     #   utility class
     #
     ###################
-    def singleton_login(self) -> HttpClient:
-        """Create or return an existing authenticated Redfish client session.
+    async def singleton_login(self) -> str:
+        """Create or return an existing authenticated Redfish session.
+
+        The cached session is trusted as is: it is not probed with an extra request,
+        an expired or deleted session is detected by the 401 of a real request in _request.
 
         Returns:
-            HttpClient: Authenticated Redfish client
+            str: X-Auth-Token of the authenticated session
 
         Raises:
-            ConnectionError: If connection to the iDRAC fails
+            RetriesExhaustedError: If connection to the iDRAC fails
             InvalidCredentialsError: If authentication fails
         """
+        if self.auth_token is not None:
+            # a validation GET used to be sent here on every api call
+            self.stats["session_checks_saved"] += 1
+            return self.auth_token
+
+        async with self._loginLock:
+            if self.auth_token is not None:
+                # logged in by a concurrent caller while this one waited
+                self.stats["logins_shared"] += 1
+                return self.auth_token
+
+            return await self._login()
+
+    async def _relogin(self, rejected: str | None) -> str:
+        """Replace a session the iDRAC rejected, once for all callers that saw it rejected.
+
+        A caller whose token was already replaced by a concurrent re-login gets the new
+        token instead of opening (and orphaning) another session.
+        """
+        async with self._loginLock:
+            if self.auth_token is not None and self.auth_token != rejected:
+                self.stats["logins_shared"] += 1
+                return self.auth_token
+
+            self.auth_token = None
+            self.session_location = None
+            token = await self._login()
+            self.stats["relogins"] += 1
+            return token
+
+    async def _login(self) -> str:
+        """Create the session, the caller holds _loginLock."""
+        _LOGGER.debug("Creating new Redfish client session")
         try:
-            # First login attempt
-            if self.logget is None:
-                _LOGGER.debug("Creating new Redfish client session")
-                self.logget = redfish.redfish_client(
-                    base_url="https://" + self.ip,
-                    max_retry=3,
-                    timeout=10
-                )
-
-                # Attempt login with credentials
-                try:
-                    self.logget.login(username=self.user, password=self.password)
-                    _LOGGER.debug("New Redfish client session created successfully")
-                    return self.logget
-                except Exception as login_err:
-                    self.logget = None
-                    _LOGGER.error("Failed to authenticate with iDRAC: %s", str(login_err))
-                    raise
+            await self._create_session()
+        except Exception as login_err:
+            self.auth_token = None
+            _LOGGER.error("Failed to authenticate with iDRAC: %s", str(login_err))
+            raise
+
+        self.stats["logins"] += 1
+        _LOGGER.debug("New Redfish client session created successfully")
+
+        if self.onSessionCreated is not None:
+            try:
+                await self.onSessionCreated()
+            except Exception as err:
+                _LOGGER.debug("Failed to record the new session of %s: %s", self.ip, err)
+        return self.auth_token
+
+    async def _create_session(self) -> None:
+        """Open a Redfish session and store its X-Auth-Token and Location."""
+        res = await self._send(
+            "POST",
+            SessionsGeneral,
+            body={"UserName": self.user, "Password": self.password},
+            authenticated=False,
+        )
+
+        if res.status in (401, 403):
+            raise InvalidCredentialsError(f"HTTP {res.status}: invalid credentials for {self.ip}")
+
+        token = res.headers.get("X-Auth-Token")
+        if res.status not in (200, 201) or token is None:
+            raise SessionCreationError(f"HTTP {res.status}: failed to create a session on {self.ip}")
+
+        self.auth_token = token
+        self.session_location = res.headers.get("Location")
+
+    async def resumeSession(self, token: str, location: str) -> bool:
+        """Adopt a session opened by an earlier run, if the iDRAC still accepts its token.
+
+        Costs one GET of the session resource instead of a new login. Returns False,
+        leaving the hub without a session, when the token was rejected.
+        """
+        self.auth_token = token
+        self.session_location = location
+
+        try:
+            res = await self._send("GET", location)
+        except Exception:
+            # unreachable: the stored session may still be good, keep it for the next try
+            self.auth_token = None
+            self.session_location = None
+            raise
+
+        if res.status != 200:
+            _LOGGER.debug("Stored session of %s rejected, a new login is needed", self.ip)
+            self.auth_token = None
+            self.session_location = None
+            return False
+
+        self.stats["sessions_resumed"] += 1
+        _LOGGER.debug("Resumed stored Redfish session of %s", self.ip)
+        return True
+
+    async def _request(self, method: str, path: str, body: dict | None = None, authenticated: bool = True, extraHeaders: dict | None = None) -> RedfishResponse:
+        """Send a request with the cached session, re-authenticating once if the iDRAC rejects it."""
+        if authenticated and self.auth_token is None:
+            await self.singleton_login()
+
+        # _send reads the token before its first await: this is the token sent
+        token = self.auth_token
+        res = await self._send(method, path, body, authenticated, extraHeaders)
+
+        if authenticated and res.status == 401:
+            _LOGGER.debug("Session rejected on %s %s, re-authenticating", method, path)
+            await self._relogin(token)
+
+            res = await self._send(method, path, body, authenticated, extraHeaders)
+
+        return res
+
+    async def _send(self, method: str, path: str, body: dict | None = None, authenticated: bool = True, extraHeaders: dict | None = None, basicAuth: bool = False) -> RedfishResponse:
+        """Send one request to the iDRAC and return the parsed response.
+
+        Connection errors and timeouts are retried up to max_retry times, except for
+        POST (power actions, sessions, subscriptions) which may have been applied
+        before the error and must not be sent twice. HTTP error statuses are returned to the caller like the redfish library does.
+        basicAuth sends the credentials instead of the session token (no session needed).
+        """
+        url = path if path.startswith("http") else self.base_url + path
+
+        headers = {"Accept": "application/json", "OData-Version": "4.0", "User-Agent": USER_AGENT}
+        if authenticated and self.auth_token is not None and not basicAuth:
+            headers["X-Auth-Token"] = self.auth_token
+        auth = aiohttp.BasicAuth(self.user, self.password) if basicAuth else None
+        if extraHeaders:
+            headers.update(extraHeaders)
+
+        attempts = 1 if method == "POST" else self.max_retry
+
+        last_err : Exception | None = None
+        for attempt in range(attempts):
+            try:
+                async with self._requestSemaphore:
+                    self.stats["requests"] += 1
+                    async with self.session.request(method, url, json=body, headers=headers, auth=auth, timeout=self.timeout, ssl=False) as resp:
+                        raw = await resp.read()
+                        status = resp.status
+                        respHeaders = resp.headers
 
-            # Session already exists, verify it's still valid
-            elif self.logget is not None:
                 try:
-                    # Test session with a lightweight request
-                    res = self.logget.get(ManagersGeneral)
+                    payload = json.loads(raw) if raw else {}
+                except ValueError:
+                    payload = {}
 
-                    # If we get an unauthorized error, re-authenticate
-                    if res.status == 401:
-                        _LOGGER.debug("Session expired, re-authenticating")
-                        self.logget.login(username=self.user, password=self.password)
-                        _LOGGER.debug("Re-authentication successful")
+                return RedfishResponse(status, payload, respHeaders, len(raw))
 
-                    return self.logget
+            except (aiohttp.ClientError, asyncio.TimeoutError) as err:
+                last_err = err
+                _LOGGER.debug("%s %s failed (attempt %d/%d): %s", method, path, attempt + 1, attempts, err)
 
-                except Exception as session_err:
-                    # If session test fails, try to create a new session
-                    _LOGGER.debug("Session test failed: %s, creating new session", str(session_err))
-                    try:
-                        # Close old session if possible
-                        try:
-                            self.logget.logout()
-                        except Exception:
-                            pass
-
-                        # Create new session
-                        self.logget = redfish.redfish_client(
-                            base_url="https://" + self.ip,
-                            max_retry=3,
-                            timeout=10
-                        )
-                        self.logget.login(username=self.user, password=self.password)
-                        return self.logget
-                    except Exception as create_err:
-                        self.logget = None
-                        _LOGGER.error("Failed to create new Redfish session: %s", str(create_err))
-                        raise
-
-            return self.logget
+        raise RetriesExhaustedError(f"{method} {path} on {self.ip}: {last_err}")
 
-        except Exception as err:
-            # Handle any uncaught exceptions
-            _LOGGER.error("Error in singleton_login: %s", str(err))
-            raise
+    async def _singleFlight(self, key: tuple, factory: Callable[[], any]) -> any:
+        """Run factory() once for all concurrent callers with the same key.
+
+        Callers arriving while the first one is in flight await the same task and get
+        the same result (or exception); a cancelled caller does not cancel the others.
+        """
+        task = self._inflight.get(key)
+        if task is not None:
+            self.stats["coalesced"] += 1
+        else:
+            task = asyncio.ensure_future(factory())
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._flightDone(key, done))
+
+        return await asyncio.shield(task)
+
+    def _flightDone(self, key: tuple, task: asyncio.Future) -> None:
+        self._inflight.pop(key, None)
+        if not task.cancelled():
+            # retrieved here too, so a flight whose callers were all cancelled does not log it as unhandled
+            task.exception()
+
+    async def _get(self, path: str) -> RedfishResponse:
+        return await self._singleFlight(("GET", path), lambda: self._getChecked(path))
+
+    async def _getChecked(self, path: str) -> RedfishResponse:
+        resp = await self._request("GET", path)
+        self._raiseForStatus(resp, "GET", path)
+        return resp
+
+    def _raiseForStatus(self, resp: RedfishResponse, method: str, path: str) -> None:
+        # an error body parsed as a resource would show (and cache) empty readings and inventory
+        if resp.status != 200:
+            raise RedfishHttpError(resp.status, method, path, self.ip)
+
+    async def _post(self, path: str, body: dict) -> RedfishResponse:
+        return await self._request("POST", path, body=body)
+
+    def _query(self, path: str, select: tuple[str, ...] | None = None, expand: bool = False) -> str:
+        """Add the $expand/$select options the iDRAC supports to path."""
+        params = []
+        if expand and self.capabilities.get("expand"):
+            # inline the members the resource links to, one level deep
+            params.append("$expand=.($levels=1)")
+        if select and self.capabilities.get("select"):
+            params.append("$select=" + ",".join(select))
+
+        return path + "?" + "&".join(params) if params else path
+
+    @staticmethod
+    def _parseCapabilities(root: dict) -> dict[str, bool]:
+        features = root.get("ProtocolFeaturesSupported") or {}
+        expand = features.get("ExpandQuery") or {}
+
+        return {
+            "expand": bool(expand.get("NoLinks") and expand.get("Levels")),
+            "select": bool(features.get("SelectQuery")),
+        }
+
+    async def _getCached(self, path: str, project: Callable[[dict], any] | None = None, select: tuple[str, ...] | None = None, expand: bool = False) -> any:
+        return await self._singleFlight(
+            ("projection", path, project, select, expand),
+            lambda: self._fetchCached(path, project, select, expand),
+        )
+
+    async def _fetchCached(self, path: str, project: Callable[[dict], any] | None = None, select: tuple[str, ...] | None = None, expand: bool = False) -> any:
+        """GET a resource conditionally, returning project(body) (the body itself by default).
+
+        The ETag of the last response is sent as If-None-Match; on 304 the projection
+        stored with it is returned as is, without downloading or parsing the body, so
+        callers and the coordinator see an identical value. Resources served without
+        an ETag are read normally.
+
+        select/expand are sent when the iDRAC advertises them; a firmware rejecting
+        them anyway (400) gets plain GETs from then on, across restarts too.
+        """
+        stats = self.etagStats.setdefault(path, {"hits": 0, "misses": 0, "bytes_saved": 0})
+
+        query = self._query(path, select, expand)
+        cached = self._etagCache.get(query)
+
+        extraHeaders = {"If-None-Match": cached[0]} if cached is not None else None
+        resp = await self._request("GET", query, extraHeaders=extraHeaders)
+
+        if resp.status == 400 and query != path:
+            _LOGGER.debug("%s rejected %s, falling back to plain GETs", self.ip, query)
+            self.capabilities = {**NO_CAPABILITIES, "rejected": True}
+            if self.onCapabilitiesRejected is not None:
+                self.onCapabilitiesRejected()
+
+            query = path
+            cached = self._etagCache.get(query)
+            extraHeaders = {"If-None-Match": cached[0]} if cached is not None else None
+            resp = await self._request("GET", query, extraHeaders=extraHeaders)
+
+        if resp.status == 304 and cached is not None:
+            stats["hits"] += 1
+            stats["bytes_saved"] += cached[2]
+            return cached[1]
+
+        if resp.status != 200:
+            self._etagCache.pop(query, None)
+            self._raiseForStatus(resp, "GET", query)
+
+        stats["misses"] += 1
+        projection = project(resp.dict) if project is not None else resp.dict
+
+        etag = resp.headers.get("ETag")
+        if etag:
+            self._etagCache[query] = (etag, projection, resp.size)
+        else:
+            self._etagCache.pop(query, None)
+
+        return projection
 
 
 
@@ -114,28 +420,40 @@ class RedfishApihub:
     #   get redfish info
     #
     ######################
-    def getRedfishInfo(self) -> dict[str, str]:
+    async def getRedfishInfo(self) -> dict[str, str]:
         dictionary = {}
 
-        dictionary["ServiceTag"] = self.getServiceTag()
-        dictionary["Members"] = self.getEmbeddedSystem()
-        dictionary["Managers"] = self.getEmbeddedManagers()
+        dictionary["ServiceTag"] = await self.getServiceTag()
+        dictionary["Members"] = await self.getEmbeddedSystem()
+        dictionary["Managers"] = await self.getEmbeddedManagers()
+        dictionary["Capabilities"] = dict(self.capabilities)
 
         return dictionary
 
-    def getServiceTag(self) -> str:
-        login = redfish.redfish_client(base_url="https://" + self.ip, max_retry=1)
-
-        ServiceTag = login.get(General).dict["Oem"]["Dell"]["ServiceTag"]
+    async def getServiceTag(self) -> str:
+        root = self.cache.get("root", General)
+        if root is ResourceCache.MISSING:
+            # the service root is readable without a session, the token is sent only if one is open
+            resp = await self._request("GET", General, authenticated=self.auth_token is not None)
+            self._raiseForStatus(resp, "GET", General)
+            root = resp.dict
+            self.cache.set("root", General, root)
+
+        # the root also tells which query options the firmware supports, unless it
+        # already rejected them: advertised again after every restart, they would
+        # cost a 400 round trip per resource each time
+        if not self.capabilities.get("rejected"):
+            self.capabilities = {**self._parseCapabilities(root), "rejected": False}
+
+        ServiceTag = root["Oem"]["Dell"]["ServiceTag"]
         return str(ServiceTag)
 
 
-    def getEmbeddedSystem(self):
+    async def getEmbeddedSystem(self):
         # {
-        logged = self.singleton_login()
+        await self.singleton_login()
 
-        resp = logged.get(SystemsGeneral)
-        lsEmmeddedSystem = resp.dict["Members"]
+        lsEmmeddedSystem = await self._getCollection(SystemsGeneral)
 
         Memebers = []
 
@@ -152,12 +470,11 @@ class RedfishApihub:
 
     # }
 
-    def getEmbeddedManagers(self):
+    async def getEmbeddedManagers(self):
     # {
-        logged = self.singleton_login()
+        await self.singleton_login()
 
-        resp = logged.get(ManagersGeneral)
-        lsEmmeddedManagers = resp.dict.get("Members")
+        lsEmmeddedManagers = await self._getCollection(ManagersGeneral)
 
         Managers = []
 
@@ -183,202 +500,340 @@ class RedfishApihub:
 
 
     #
-    # setup functions
+    # system snapshot
 
-    def getEmbSysInfo(self, idEmbSys) -> dict[str, str]:
+    async def getSystemSnapshot(self, idEmbSys, maxAge: float | None = None) -> dict[str, any]:
     # {
-        logged = self.singleton_login()
+        """Return the parsed Systems/{id} resource, fetching it at most once per maxAge seconds.
 
-        dictionary = {}
+        Power state, health, device info, reset actions and CooledBy/PoweredBy links
+        all come from this one resource, so every getter below reads the same snapshot.
+        maxAge defaults to the TTL of the "system" resource class.
+        """
+        snapshot = self.cache.get("system", str(idEmbSys), maxAge)
+        if snapshot is not ResourceCache.MISSING:
+            return snapshot
 
-        resRedfish = logged.get(SystemSpecific.substitute({'EmbeddedSystemID' : str(idEmbSys)}))
-        #_LOGGER.info(msg=str(resRedfish))
+        await self.singleton_login()
 
-        dictionary["name"] = resRedfish.dict.get('HostName')
-        dictionary["model"] = resRedfish.dict.get('Model')
-        dictionary["manufacturer"] = resRedfish.dict.get('Manufacturer')
-        dictionary["sw_version"] = resRedfish.dict.get('BiosVersion')
+        snapshot = await self._getCached(SystemSpecific.substitute({'EmbeddedSystemID' : str(idEmbSys)}), self._parseSystem, select=SYSTEM_SELECT)
 
-        return dictionary
+        # the slow changing part is served from the longer lived inventory class
+        self.cache.set("system", str(idEmbSys), snapshot)
+        self.cache.set("inventory", str(idEmbSys), snapshot)
+        return snapshot
     # }
 
-    def getEmbSysPowerActions(self, idEmbSys) -> list[str]:
-    # {
-        logged = self.singleton_login()
+    async def _getInventorySnapshot(self, idEmbSys) -> dict[str, any]:
+        """Systems/{id} snapshot for model, BIOS, reset types and links, reused up to the inventory TTL."""
+        snapshot = self.cache.get("inventory", str(idEmbSys))
+        if snapshot is not ResourceCache.MISSING:
+            return snapshot
 
-        resRedfish = logged.get(SystemSpecific.substitute({'EmbeddedSystemID' : str(idEmbSys)}))
-        #_LOGGER.info(msg=str(resRedfish))
+        return await self.getSystemSnapshot(idEmbSys)
 
-        return resRedfish.dict.get('Actions').get('#ComputerSystem.Reset').get('ResetType@Redfish.AllowableValues')
-    # }
+    @classmethod
+    def _parseSystem(cls, system: dict) -> dict[str, any]:
+        links = system.get("Links") or {}
+        resetAction = (system.get('Actions') or {}).get('#ComputerSystem.Reset') or {}
+
+        snapshot : dict = {}
+        snapshot["PowerState"] = system.get('PowerState', None)
+        snapshot["Health"] = (system.get('Status') or {}).get('Health')
+        snapshot["HostName"] = system.get('HostName')
+        snapshot["Model"] = system.get('Model')
+        snapshot["Manufacturer"] = system.get('Manufacturer')
+        snapshot["BiosVersion"] = system.get('BiosVersion')
+        snapshot["ResetTypes"] = resetAction.get('ResetType@Redfish.AllowableValues') or []
+        snapshot["CooledBy"] = [cls._memberID(elm) for elm in links.get("CooledBy") or []]
+        snapshot["PoweredBy"] = [cls._memberID(elm) for elm in links.get("PoweredBy") or []]
+
+        return snapshot
 
+    def invalidateSystemSnapshot(self, idEmbSys = None) -> None:
+        """Drop the cached snapshot of one system (or of all of them) so the next read hits the iDRAC."""
+        self.cache.invalidate("system", None if idEmbSys is None else str(idEmbSys))
 
-    def getEmbeddedSystemCooledBy(self, idEmbSys) -> list[str]:
+    def invalidateResources(self, resourceClass: str | None = None, key: str | None = None) -> None:
+        """Drop cached resources of a class (all classes by default), optionally only one key."""
+        self.cache.invalidate(resourceClass, key)
+
+
+    #
+    # setup functions
+
+    async def getEmbSysInfo(self, idEmbSys) -> dict[str, str]:
     # {
-        logged = self.singleton_login()
+        snapshot = await self._getInventorySnapshot(idEmbSys)
 
-        resp = logged.get(SystemSpecific.substitute({'EmbeddedSystemID' : str(idEmbSys)}))
+        dictionary = {}
 
-        lsFan = resp.dict.get("Links",{}).get("CooledBy")
-        #_LOGGER.info( "all fans cooling raw: " + str(lsFan) )
+        dictionary["name"] = snapshot["HostName"]
+        dictionary["model"] = snapshot["Model"]
+        dictionary["manufacturer"] = snapshot["Manufacturer"]
+        dictionary["sw_version"] = snapshot["BiosVersion"]
 
-        fanID = []
+        return dictionary
+    # }
 
-        for elm in lsFan:
-            id_elm = elm.get("@odata.id").split("/")
-            fanID.append( id_elm[(len(id_elm) - 1)] )
+    async def getSystemInventory(self, idEmbSys) -> dict[str, dict]:
+    # {
+        """Everything the platforms need to create the entities of a system (V2 entry layout).
 
-        return fanID
+        Temperature names come from a Thermal read, which is empty while the host is
+        off; callers keep the names they already know in that case.
+        """
+        try:
+            temperatures = list((await self.getThermalSensors(idEmbSys))[TEMPERATURE])
+        except (RedfishHttpError, RetriesExhaustedError, aiohttp.ClientError, asyncio.TimeoutError, KeyError) as err:
+            _LOGGER.debug("No temperature sensors for %s: %s", idEmbSys, err)
+            temperatures = []
+
+        return {
+            "DeviceInfo": await self.getEmbSysInfo(idEmbSys),
+            "DeviceSensor": {
+                "fans": await self.getEmbeddedSystemCooledBy(idEmbSys),
+                "TemperatureSensor": temperatures,
+                "PSU": await self.getEmbeddedSystemPoweredBy(idEmbSys),
+            },
+            "SystemActions": {
+                "PowerAction": await self.getEmbSysPowerActions(idEmbSys),
+            },
+        }
     # }
 
-    def getEmbeddedSystemPoweredBy(self, idEmbSys) -> list[str]:
+    async def getEmbSysPowerActions(self, idEmbSys) -> list[str]:
     # {
-        logged = self.singleton_login()
+        snapshot = await self._getInventorySnapshot(idEmbSys)
+
+        return list(snapshot["ResetTypes"])
+    # }
 
-        resp = logged.get(SystemSpecific.substitute({'EmbeddedSystemID' : str(idEmbSys)}))
 
-        lsPSU = resp.dict.get("Links",{}).get("PoweredBy")
-        #_LOGGER.info( "all PSUs powering raw: " + str(lsPSU) )
+    async def getEmbeddedSystemCooledBy(self, idEmbSys) -> list[str]:
+    # {
+        snapshot = await self._getInventorySnapshot(idEmbSys)
 
-        psuID = []
+        return list(snapshot["CooledBy"])
+    # }
 
-        for elm in lsPSU:
-            id_elm = elm.get("@odata.id").split("/")
-            psuID.append( id_elm[(len(id_elm) - 1)] )
+    async def getEmbeddedSystemPoweredBy(self, idEmbSys) -> list[str]:
+    # {
+        snapshot = await self._getInventorySnapshot(idEmbSys)
 
-        return psuID
+        return list(snapshot["PoweredBy"])
     # }
 
 
     # poolling functions
 
-    def getpowerState(self, idEmbSys) -> dict[str, str]:
-        logged = self.singleton_login()
+    async def getpowerState(self, idEmbSys) -> dict[str, str]:
+        snapshot = await self.getSystemSnapshot(idEmbSys)
 
         dictionary = {}
-
-        resRedfish = logged.get(SystemSpecific.substitute({'EmbeddedSystemID' : str(idEmbSys)}))
-        dictionary["state"] = resRedfish.dict.get('PowerState', None)
+        dictionary["state"] = snapshot["PowerState"]
 
         return dictionary
 
 
-    def getHealthStatus(self, idEmbSys) -> dict[str, str]:
-        logged = self.singleton_login()
+    async def getHealthStatus(self, idEmbSys) -> dict[str, str]:
+        snapshot = await self.getSystemSnapshot(idEmbSys)
 
         dictionary = {}
-
-        resRedfish = logged.get(SystemSpecific.substitute({'EmbeddedSystemID' : str(idEmbSys)}))
-        dictionary["health"] = resRedfish.dict.get('Status').get('Health')
+        dictionary["health"] = snapshot["Health"]
 
         return dictionary
 
 
-    def getFanSensor(self, idEmbSys, idFan):
+    async def getFanSensor(self, idEmbSys, idFan):
     # {
-        logged = self.singleton_login()
+        await self.singleton_login()
         #_LOGGER.info(msg="preso sensore fans: "+idFan)
 
-        resp = logged.get( path = ChassisFans.substitute( {'EmbeddedSystemID' : str(idEmbSys), 'FanID': str(idFan) } ) )
+        resp = await self._get( path = ChassisFans.substitute( {'EmbeddedSystemID' : str(idEmbSys), 'FanID': str(idFan) } ) )
 
         return str(resp.dict.get("Reading"))
     # }
 
-    def getPSUSensor(self, idEmbSys, idPSU) -> dict[str, any]:
+    async def getPSUSensor(self, idEmbSys, idPSU) -> dict[str, any]:
     # {
-        logged = self.singleton_login()
+        await self.singleton_login()
         #_LOGGER.info(msg="preso sensore PSU: "+idPSU)
 
-        resp = logged.get( path = ChassisPSU.substitute( {'EmbeddedSystemID' : str(idEmbSys), 'PSUid': str(idPSU) } ) )
+        resp = await self._get( path = ChassisPSU.substitute( {'EmbeddedSystemID' : str(idEmbSys), 'PSUid': str(idPSU) } ) )
 
+        return self._parsePSU(resp.dict)
+    # }
+
+    @staticmethod
+    def _parsePSU(psu: dict) -> dict[str, any]:
         respDict : dict = {}
 
-        respDict['Name'] = resp.dict.get('Name')
-        respDict['LineInputVoltage'] = resp.dict.get('LineInputVoltage')
-        respDict['PowerCapacityWatts'] = resp.dict.get('PowerCapacityWatts')
-        respDict['LastPowerOutputWatts'] = resp.dict.get('LastPowerOutputWatts')
+        respDict['Name'] = psu.get('Name')
+        respDict['LineInputVoltage'] = psu.get('LineInputVoltage')
+        respDict['PowerCapacityWatts'] = psu.get('PowerCapacityWatts')
+        respDict['LastPowerOutputWatts'] = psu.get('LastPowerOutputWatts')
 
-        status = resp.dict.get('Status')
+        status = psu.get('Status')
         if status is not None:
             respDict['Health'] = status.get('Health')
 
-        respDict['Model'] = resp.dict.get('Model')
-        respDict['SerialNumber'] = resp.dict.get('SerialNumber')
+        respDict['Model'] = psu.get('Model')
+        respDict['SerialNumber'] = psu.get('SerialNumber')
 
         return respDict
+
+    async def getAllFan(self, idEmbSys):
+    # {
+        thermal = await self._getThermal(idEmbSys)
+
+        return await self._resolveMembers(thermal.get("Fans", []), THERMAL_FAN_FIELDS)
     # }
 
-    def getAllFan(self, idEmbSys):
+
+    async def getElectricitySensor(self, idEmbSys) -> dict[str, any]:
     # {
-        logged = self.singleton_login()
+        await self.singleton_login()
 
-        resp = logged.get( path = ChassisGenThermal.substitute( {'EmbeddedSystemID' : str(idEmbSys) } ) )
+        resp = await self._get( path = ChassisConsumptions.substitute( {'EmbeddedSystemID' : str(idEmbSys) } ) )
 
-        #_LOGGER.info("response temp sensor: ", str(resp))
-        vectorTemp = resp.dict.get("Fans", [])
+        return self._parsePowerControl(resp.dict)
+    # }
 
+    @staticmethod
+    def _parsePowerControl(powerControl: dict) -> dict[str, any]:
+        respDict : dict = {}
 
-        listAllFanSensorReading = []
-        for elm in vectorTemp:
+        respDict['PowerCapacityWatts'] = powerControl.get('PowerCapacityWatts')
+        respDict['PowerConsumedWatts'] = powerControl.get('PowerConsumedWatts')
 
-            tmp = elm.get("@odata.id")
-            listAllFanSensorReading.append( logged.get( path = tmp ).dict )
 
-        #_LOGGER.info("temp apir response: "+str(listTemperatureSensorReading))
-        return listAllFanSensorReading
-    # }
+        Powerlimit = powerControl.get('PowerLimit') #LimitInWatts
+        if Powerlimit is not None:
+            respDict['PowerLimitWatts'] = Powerlimit.get('LimitInWatts')
+            respDict['PowerLimitPolicy'] = Powerlimit.get('LimitException')
+
 
+        return respDict
 
-    def getElectricitySensor(self, idEmbSys) -> dict[str, any]:
+    async def getPowerSensors(self, idEmbSys) -> dict[str, dict]:
     # {
-        logged = self.singleton_login()
+        """Read every PSU and the consumption sensor from a single Chassis Power response.
 
-        resp = logged.get( path = ChassisConsumptions.substitute( {'EmbeddedSystemID' : str(idEmbSys) } ) )
+        Members missing from the inline PowerSupplies[]/PowerControl[] arrays fall
+        back to per-member GETs, like the Thermal read does.
 
-        respDict : dict = {}
+        Returns:
+            dict: {PSU: {psuID: psuData}, WATTSENSOR: powerControlData}
+        """
+        await self.singleton_login()
 
-        respDict['PowerCapacityWatts'] = resp.dict.get('PowerCapacityWatts')
-        respDict['PowerConsumedWatts'] = resp.dict.get('PowerConsumedWatts')
+        power = await self._getCached( path = ChassisPower.substitute( {'EmbeddedSystemID' : str(idEmbSys) } ), select=POWER_SELECT, expand=True )
 
+        psus = await self._resolveMembers(power.get("PowerSupplies", []), POWER_PSU_FIELDS)
+        powerControl = await self._resolveMembers(power.get("PowerControl", []), POWER_CONTROL_FIELDS)
 
-        Powerlimit = resp.dict.get('PowerLimit') #LimitInWatts
-        if Powerlimit is not None:
-            respDict['PowerLimitWatts'] = Powerlimit.get('LimitInWatts')
-            respDict['PowerLimitPolicy'] = Powerlimit.get('LimitException')
+        respDict : dict = {PSU: {}, WATTSENSOR: {}}
+
+        for elm in psus:
+            respDict[PSU][self._memberID(elm)] = self._parsePSU(elm)
 
+        if powerControl:
+            respDict[WATTSENSOR] = self._parsePowerControl(powerControl[0])
+        else:
+            # firmware without an inline PowerControl array
+            respDict[WATTSENSOR] = await self.getElectricitySensor(idEmbSys)
 
         return respDict
     # }
 
-    def getTemperatureSensor(self, idEmbSys):
+    async def getTemperatureSensor(self, idEmbSys):
     # {
-        logged = self.singleton_login()
+        thermal = await self._getThermal(idEmbSys)
 
-        resp = logged.get( path = ChassisGenThermal.substitute( {'EmbeddedSystemID' : str(idEmbSys) } ) )
+        return await self._resolveMembers(thermal.get("Temperatures", []), THERMAL_TEMPERATURE_FIELDS)
+    # }
+
+    async def getThermalSensors(self, idEmbSys) -> dict[str, dict]:
+    # {
+        """Read every fan and temperature sensor from a single Thermal response.
 
-        #_LOGGER.info("response temp sensor: ", str(resp))
-        vectorTemp = resp.dict.get("Temperatures", [])
+        Returns:
+            dict: {FANS: {fanID: rpm}, TEMPERATURE: {sensorName: celsius}}
+        """
+        thermal = await self._getThermal(idEmbSys)
 
+        fans = await self._resolveMembers(thermal.get("Fans", []), THERMAL_FAN_FIELDS)
+        temperatures = await self._resolveMembers(thermal.get("Temperatures", []), THERMAL_TEMPERATURE_FIELDS)
 
-        listTemperatureSensorReading = []
-        for elm in vectorTemp:
+        respDict : dict = {FANS: {}, TEMPERATURE: {}}
 
-            tmp = elm.get("@odata.id")
-            listTemperatureSensorReading.append( logged.get( path = tmp ).dict )
+        for elm in fans:
+            respDict[FANS][self._memberID(elm)] = elm.get("Reading")
 
-        #_LOGGER.info("temp apir response: "+str(listTemperatureSensorReading))
-        return listTemperatureSensorReading
+        for elm in temperatures:
+            sensor_name = elm.get("Name")
+            if sensor_name:
+                respDict[TEMPERATURE][sensor_name] = elm.get("ReadingCelsius")
 
+        return respDict
     # }
 
+    async def _getCollection(self, path: str) -> list[dict]:
+        """Members of a collection, reused up to the collection TTL."""
+        members = self.cache.get("collection", path)
+        if members is ResourceCache.MISSING:
+            members = (await self._get(path)).dict.get("Members") or []
+            self.cache.set("collection", path, members)
+
+        return members
+
+    async def _getThermal(self, idEmbSys) -> dict:
+        await self.singleton_login()
+
+        return await self._getCached( path = ChassisGenThermal.substitute( {'EmbeddedSystemID' : str(idEmbSys) } ), select=THERMAL_SELECT, expand=True )
+
+    async def _resolveMembers(self, members: list[dict], requiredFields: tuple[str, ...]) -> list[dict]:
+        """Return the member payloads of an inline array.
+
+        In inline-first mode an entry already carrying every required field is used
+        as is; its @odata.id is followed only when a field is missing (older firmware
+        returns bare links). With inline_first disabled every member link is fetched.
+        """
+        async def resolve(elm: dict) -> dict | None:
+            if self.inline_first and all(field in elm for field in requiredFields):
+                return elm
+
+            tmp = elm.get("@odata.id")
+            if tmp is None:
+                return None
+            return (await self._get( path = tmp )).dict
+
+        # missing members are fetched in parallel, bounded by the per-host semaphore
+        resolved = await asyncio.gather(*(resolve(elm) for elm in members))
+
+        return [elm for elm in resolved if elm is not None]
+
+    @staticmethod
+    def _memberID(elm: dict) -> str:
+        """Last segment of a member @odata.id, the same id used in CooledBy/PoweredBy links."""
+        odata_id = elm.get("@odata.id")
+        if odata_id:
+            return odata_id.rstrip("/").split("/")[-1]
+        return str(elm.get("MemberId"))
+
     ## azioni
 
     # power actions
-    def pressPowerStatusButton(self, idEmbSys , actions : str):
+    async def pressPowerStatusButton(self, idEmbSys , actions : str):
     # {
-        logged = self.singleton_login()
+        await self.singleton_login()
+
+        resRedfish = await self._post(path=SetPowerStatus.substitute({'EmbeddedSystemID' : str(idEmbSys)}), body={ 'ResetType': actions } )
 
-        resRedfish = logged.post(path=SetPowerStatus.substitute({'EmbeddedSystemID' : str(idEmbSys)}), body={ 'ResetType': actions } )
+        # power state, health and (after a reset) BIOS data of this system are stale now
+        self.cache.invalidate("system", str(idEmbSys))
+        self.cache.invalidate("inventory", str(idEmbSys))
         #_LOGGER.info("res status power button: "+str(resRedfish.status))
         #_LOGGER.info("res power button: "+str(resRedfish))
     # }
@@ -394,12 +849,12 @@ class RedfishApihub:
     #
     # setup functions
 
-    def getManiDracInfo(self, idManiDrac) -> dict[str, str]:
-        logged = self.singleton_login()
+    async def getManiDracInfo(self, idManiDrac) -> dict[str, str]:
+        await self.singleton_login()
 
         dictionary = {}
 
-        resRedfish = logged.get(SystemSpecific.substitute({'EmbeddedSystemID' : str(idManiDrac)}))
+        resRedfish = await self._get(SystemSpecific.substitute({'EmbeddedSystemID' : str(idManiDrac)}))
         #_LOGGER.info(msg=str(resRedfish))
 
         dictionary["name"] = resRedfish.dict.get('name')
@@ -416,7 +871,7 @@ class RedfishApihub:
     #
     ########################
 
-    def check_sse_support(self) -> dict[str, bool | str]:
+    async def check_sse_support(self) -> dict[str, bool | str]:
         """Check if the iDRAC supports Server-Sent Events.
 
         Returns:
@@ -425,26 +880,32 @@ class RedfishApihub:
                 - "event_service_supported": bool - True if Event Service endpoint exists
                 - "subscription_supported": bool - True if subscriptions are supported
                 - "version": str - Redfish version
+                - "sse_uri": str | None - ServerSentEventUri of the EventService
                 - "message": str - Descriptive message about support status
+
+        Raises:
+            RetriesExhaustedError, RedfishHttpError...: when the probe itself failed, so a
+                transient error is not mistaken for an iDRAC without EventService
         """
         result = {
             "supports_sse": False,
             "event_service_supported": False,
             "subscription_supported": False,
             "version": "unknown",
+            "sse_uri": None,
             "message": "SSE not supported"
         }
 
         try:
-            logged = self.singleton_login()
+            await self.singleton_login()
 
             # Check Redfish version
-            root_data = logged.get("/redfish/v1/").dict
+            root_data = (await self._get("/redfish/v1/")).dict
             result["version"] = root_data.get("RedfishVersion", "unknown")
 
             # Check if EventService exists
             try:
-                event_service = logged.get("/redfish/v1/EventService")
+                event_service = await self._get("/redfish/v1/EventService")
                 if event_service.status == 200:
                     result["event_service_supported"] = True
                     event_data = event_service.dict
@@ -457,15 +918,21 @@ class RedfishApihub:
                     # Check EventService capabilities
                     if event_data.get("ServerSentEventUri"):
                         result["supports_sse"] = True
+                        result["sse_uri"] = event_data["ServerSentEventUri"]
 
                     # Check if subscriptions are supported
                     try:
-                        subscriptions = logged.get("/redfish/v1/EventService/Subscriptions")
+                        subscriptions = await self._get("/redfish/v1/EventService/Subscriptions")
                         if subscriptions.status == 200:
                             result["subscription_supported"] = True
-                    except Exception:
+                    except RedfishHttpError as err:
+                        if err.status not in UNSUPPORTED_STATUSES:
+                            raise
                         _LOGGER.debug("EventService subscriptions endpoint not supported")
-            except Exception:
+            except RedfishHttpError as err:
+                # only "no such resource" means unsupported, a busy iDRAC (5xx) is a failed probe
+                if err.status not in UNSUPPORTED_STATUSES:
+                    raise
                 _LOGGER.debug("EventService endpoint not supported")
 
             # Set appropriate message
@@ -477,20 +944,20 @@ class RedfishApihub:
                 result["message"] = "EventService is not supported, SSE not available"
 
         except Exception as err:
-            _LOGGER.error("Error checking SSE support: %s", err)
-            result["message"] = f"Error checking SSE support: {str(err)}"
+            _LOGGER.debug("Error checking SSE support: %s", err)
+            raise
 
         return result
 
-    def test_eventservice_capabilities(self) -> dict:
+    async def test_eventservice_capabilities(self) -> dict:
         """Test and return all EventService capabilities.
 
         Returns:
             dict: Raw EventService data if available, or error information
         """
         try:
-            logged = self.singleton_login()
-            event_service = logged.get("/redfish/v1/EventService")
+            await self.singleton_login()
+            event_service = await self._get("/redfish/v1/EventService")
 
             if event_service.status == 200:
                 return event_service.dict
@@ -500,28 +967,146 @@ class RedfishApihub:
             return {"error": f"Error accessing EventService: {str(err)}"}
 
 
-    # deletion of class
-    def __del__(self) -> None:
-        """Clean up resources when this object is being garbage collected.
+    async def createEventSubscription(self, destination: str, context: str) -> str | None:
+        """Subscribe destination to Alert events pushed over HTTP, return the subscription URI."""
+        await self.singleton_login()
+
+        resp = await self._post(EventSubscriptions, body={
+            "Destination": destination,
+            "EventTypes": ["Alert"],
+            "Context": context,
+            "Protocol": "Redfish",
+        })
+        if resp.status not in (200, 201, 204):
+            self._raiseForStatus(resp, "POST", EventSubscriptions)
+
+        return resp.headers.get("Location")
+
+    async def getEventSubscription(self, location: str) -> dict | None:
+        """The subscription at location, None once the iDRAC no longer has it (reset, purge)."""
+        try:
+            return (await self._get(location)).dict
+        except RedfishHttpError as err:
+            if err.status == 404:
+                return None
+            raise
+
+    async def deleteEventSubscription(self, location: str) -> None:
+        await self._request("DELETE", location)
+
+    async def deleteEventSubscriptions(self, context: str) -> int:
+        """Delete every subscription carrying context, return how many were removed."""
+        await self.singleton_login()
+
+        members = (await self._getCached(EventSubscriptions, expand=True)).get("Members", [])
+        subscriptions = await self._resolveMembers(members, ("Context",))
+
+        removed = 0
+        for sub in subscriptions:
+            if sub.get("Context") == context and sub.get("@odata.id"):
+                await self.deleteEventSubscription(sub["@odata.id"])
+                removed += 1
+
+        return removed
+
+    async def openEventStream(self, uri: str, readTimeout: float) -> aiohttp.ClientResponse:
+        """Open the EventService SSE stream, the caller reads and releases the response.
+
+        The stream stays open for the life of the listener, so it is not counted
+        against the request semaphore.
+        """
+        url = uri if uri.startswith("http") else self.base_url + uri
+        timeout = aiohttp.ClientTimeout(total=None, sock_connect=10, sock_read=readTimeout)
+
+        for attempt in range(2):
+            await self.singleton_login()
+
+            token = self.auth_token
+            headers = {"Accept": "text/event-stream", "User-Agent": USER_AGENT, "X-Auth-Token": token}
+            self.stats["requests"] += 1
+            resp = await self.session.get(url, headers=headers, timeout=timeout, ssl=False)
+
+            if resp.status == 401 and attempt == 0:
+                resp.release()
+                _LOGGER.debug("Session rejected on event stream %s, re-authenticating", uri)
+                await self._relogin(token)
+                continue
+
+            if resp.status != 200:
+                resp.release()
+                raise aiohttp.ClientResponseError(resp.request_info, resp.history, status=resp.status, message="event stream refused")
+
+            return resp
+
+        raise InvalidCredentialsError(f"event stream {uri} on {self.ip}: session rejected")
+
+
+    # session table
+
+    async def sweepSessions(self, knownLocations: list[str] | None = None, basicAuth: bool = False) -> list[str]:
+        """Delete stale sessions of this integration, return the knownLocations now gone.
+
+        A session is ours when its URI is one of knownLocations (sessions this
+        integration recorded and did not close), or when it belongs to our user and
+        mentions USER_AGENT (firmware reporting the client user agent). The current
+        session is never touched. With basicAuth the sweep works without a session,
+        which is what is left when the session table is full.
 
-        Safely logs out of the Redfish session if one exists.
+        A known location is gone when its DELETE succeeded or the iDRAC no longer
+        lists it (expired); one whose DELETE failed is not returned, to be retried.
         """
-        self._safe_logout()
+        known = {urlparse(location).path.rstrip("/"): location for location in knownLocations or []}
+        current = urlparse(self.session_location).path.rstrip("/") if self.session_location else None
 
-    def _safe_logout(self) -> None:
+        resp = await self._send("GET", SessionsGeneral, basicAuth=basicAuth)
+        self._raiseForStatus(resp, "GET", SessionsGeneral)
+
+        listed = {(member.get("@odata.id") or "").rstrip("/") for member in resp.dict.get("Members", [])}
+        gone = [location for uri, location in known.items() if uri not in listed]
+
+        removed = 0
+        for uri in listed:
+            if not uri or uri == current:
+                continue
+
+            if uri in known:
+                stale = True
+            else:
+                session = (await self._send("GET", uri, basicAuth=basicAuth)).dict
+                stale = session.get("UserName") == self.user and USER_AGENT in json.dumps(session)
+
+            if stale:
+                res = await self._send("DELETE", uri, basicAuth=basicAuth)
+                if res.status in (200, 202, 204):
+                    removed += 1
+                    if uri in known:
+                        gone.append(known[uri])
+
+        self.stats["stale_sessions_removed"] += removed
+        if removed:
+            _LOGGER.info("Removed %d stale Redfish sessions from %s", removed, self.ip)
+        return gone
+
+
+    # end of session
+    async def logout(self) -> None:
         """Safely log out from the Redfish session.
 
         Handles exceptions and ensures proper cleanup.
         """
-        if self.logget is None:
-            return
+        async with self._loginLock:
+            if self.auth_token is None:
+                return
 
-        try:
-            _LOGGER.debug("Logging out of Redfish session")
-            self.logget.logout()
-            _LOGGER.debug("Successfully logged out of Redfish session")
-        except Exception as err:
-            _LOGGER.debug("Error during Redfish logout: %s", str(err))
-        finally:
-            # Always clear the session reference
-            self.logget = None
+            try:
+                _LOGGER.debug("Logging out of Redfish session")
+                if self.session_location is not None:
+                    # _send: a rejected token must not trigger a new login here
+                    await self._send("DELETE", self.session_location)
+                _LOGGER.debug("Successfully logged out of Redfish session")
+            except Exception as err:
+                _LOGGER.debug("Error during Redfish logout: %s", str(err))
+            finally:
+                # Always clear the session reference
+                self.auth_token = None
+                self.session_location = None
@@ -1,18 +1,48 @@
 """Integration for Dell iDRAC Redfish interface."""
 from __future__ import annotations
 
+import copy
+import functools
 import logging
 
 #homeassistant import
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant
+from homeassistant.components import webhook
+from homeassistant.const import CONF_WEBHOOK_ID, Platform
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryNotReady
 from homeassistant.const import CONF_HOST, CONF_USERNAME, CONF_PASSWORD
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
 #local import
-from .const import DOMAIN, DELAY_TIME
+from .api_manager import ApiRequestManager
+from .coordinator import IdracCoordinator
+from .event_listener import RedfishSseListener, RedfishWebhookSubscription
+from .const import (
+    DOMAIN,
+    DELAY_TIME,
+    FLOW_HANDOFF,
+    ADAPTIVE_INTERVAL_MAX,
+    ADAPTIVE_POLLING,
+    ADAPTIVE_THRESHOLD,
+    ADAPTIVE_THRESHOLD_DEFAULT,
+    INTERVAL_FAST,
+    INTERVAL_MAX,
+    INTERVAL_SLOW,
+    MAX_CONCURRENT,
+    MAX_CONCURRENT_REQUESTS,
+    PRIORITY_CRITICAL,
+    PRIORITY_LOW,
+    REQUEST_TIMEOUT_DEFAULT,
+    TIER_FAST,
+    TIER_NORMAL,
+    TIER_SLOW,
+    UPDATE_INTERVAL_FAST,
+    UPDATE_INTERVAL_NORMAL,
+    UPDATE_INTERVAL_SLOW,
+)
 from .RedfishApi import RedfishApihub
+from .session_lease import SessionLease, async_remove_entry_session
 
 
 _LOGGER = logging.getLogger(__name__)
@@ -26,24 +56,226 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> b
     host = api_data.get(CONF_HOST, "")
     username = api_data.get(CONF_USERNAME, "")
     password = api_data.get(CONF_PASSWORD, "")
+    max_concurrent = int(api_data.get(MAX_CONCURRENT, MAX_CONCURRENT_REQUESTS))
 
+    lease = None
     try:
-        api = RedfishApihub(host, username, password)
+        # a just created entry adopts the logged in hub of its config flow
+        api = hass.data.get(DOMAIN, {}).get(FLOW_HANDOFF, {}).pop(config_entry.data["info"]["ServiceTag"], None)
+        if api is not None and api.ip != host:
+            # host changed since the flow, not the session to reuse
+            hass.async_create_task(api.logout())
+            api = None
+        if api is None:
+            api = RedfishApihub(host, username, password, async_get_clientsession(hass, verify_ssl=False), max_concurrent=max_concurrent)
 
-        # Validate connection
-        await hass.async_add_executor_job(api.getRedfishInfo)
+        # single gateway for every Redfish call of this entry
+        api_manager = ApiRequestManager(hass, max_concurrent)
+
+        # resumes the session stored by the last run, stale ones of earlier runs are deleted here
+        lease = SessionLease(hass, config_entry, api, api_manager)
+        await lease.async_acquire()
+
+        # the entry holds the discovery of the last run (V2 layout): only systems never
+        # discovered cost requests here, the rest is revalidated once the entities exist
+        info = dict(config_entry.data["info"])
+        api.capabilities.update(info.get("Capabilities", {}))
+        api.onCapabilitiesRejected = functools.partial(_store_capabilities, hass, config_entry, api)
+
+        info["Members"] = [dict(member) for member in info["Members"]]
+        undiscovered = [
+            member for member in info["Members"] if member.get("enable", True) and "DeviceSensor" not in member
+        ]
+        for member in undiscovered:
+            member.update(
+                await api_manager.request(api.getSystemInventory, member["id"], priority=PRIORITY_LOW, timeout=REQUEST_TIMEOUT_DEFAULT)
+            )
+
+        if "EventService" not in info:
+            try:
+                info["EventService"] = _event_service(
+                    await api_manager.request(api.check_sse_support, priority=PRIORITY_LOW, timeout=REQUEST_TIMEOUT_DEFAULT)
+                )
+            except Exception as err:
+                # push is optional: poll for now, the background revalidation probes again
+                _LOGGER.warning("iDRAC %s: EventService probe failed, polling only: %s", host, err)
     except Exception as e:
         _LOGGER.error("Failed to connect to iDRAC host %s: %s", host, e)
+        if lease is not None:
+            await _async_suspend(lease, api_manager)
         raise ConfigEntryNotReady(f"Failed to connect to iDRAC: {e}") from e
 
-    # Store API instance for platforms to access
-    hass.data.setdefault(DOMAIN, {})[config_entry.entry_id] = api
+    # a $select/$expand rejection during discovery must not be overwritten below
+    info["Capabilities"] = dict(api.capabilities)
+    if info != config_entry.data["info"]:
+        hass.config_entries.async_update_entry(config_entry, data={**config_entry.data, "info": info})
+
+    # one coordinator for every platform and embedded system of this iDRAC
+    embedded_systems = [
+        emb_sys["id"] for emb_sys in config_entry.data["info"]["Members"] if emb_sys.get("enable", True)
+    ]
+    intervals, adaptive_threshold, interval_max = _polling_options(api_data)
+    coordinator = IdracCoordinator(
+        hass,
+        config_entry,
+        api,
+        api_manager,
+        embedded_systems,
+        intervals,
+        adaptive_threshold=adaptive_threshold,
+        interval_max=interval_max,
+    )
+    try:
+        await coordinator.async_config_entry_first_refresh()
+    except Exception:
+        await _async_suspend(lease, api_manager)
+        raise
+
+    # Store API instance, its request manager and the coordinator for platforms to access
+    hass.data.setdefault(DOMAIN, {})[config_entry.entry_id] = {
+        "api": api,
+        "api_manager": api_manager,
+        "coordinator": coordinator,
+        "session_lease": lease,
+    }
 
     # Forward setup to platforms
     await hass.config_entries.async_forward_entry_setups(config_entry, PLATFORMS)
 
+    # push path: stream EventService events when the iDRAC offers SSE, polling stays the fallback
+    event_service = info.get("EventService", {"sse_uri": None, "subscription_supported": False})
+    if event_service["sse_uri"]:
+        listener = RedfishSseListener(hass, api, coordinator, event_service["sse_uri"])
+        hass.data[DOMAIN][config_entry.entry_id]["event_listener"] = listener
+        listener.async_start()
+    elif event_service["subscription_supported"]:
+        # no SSE (iDRAC7): have the iDRAC push events to a webhook instead
+        if CONF_WEBHOOK_ID not in config_entry.data:
+            hass.config_entries.async_update_entry(
+                config_entry, data={**config_entry.data, CONF_WEBHOOK_ID: webhook.async_generate_id()}
+            )
+
+        subscription = RedfishWebhookSubscription(hass, api, coordinator, config_entry.data[CONF_WEBHOOK_ID])
+        try:
+            await api_manager.request(subscription.async_subscribe, priority=PRIORITY_LOW, timeout=REQUEST_TIMEOUT_DEFAULT, retries=1)
+            hass.data[DOMAIN][config_entry.entry_id]["event_subscription"] = subscription
+        except Exception as err:
+            _LOGGER.warning("iDRAC %s: event subscription failed, polling only: %s", host, err)
+    else:
+        _LOGGER.debug("iDRAC %s: no EventService push, polling only", host)
+
+    # entry data the running setup reflects, later updates are applied as a diff against it
+    hass.data[DOMAIN][config_entry.entry_id]["applied"] = copy.deepcopy(dict(config_entry.data))
+
     # Register update listener for config entry changes
-    config_entry.async_on_unload(config_entry.add_update_listener(async_reload_entry))
+    config_entry.async_on_unload(config_entry.add_update_listener(async_entry_updated))
+
+    # the stored discovery may be outdated (hardware, firmware): check it without delaying startup
+    config_entry.async_create_background_task(
+        hass, _async_revalidate_discovery(hass, config_entry, api, api_manager), f"{DOMAIN} revalidate {host}"
+    )
+
+    return True
+
+
+async def _async_suspend(lease: SessionLease, api_manager: ApiRequestManager) -> None:
+    """Stop a setup that did not complete, keeping its session stored for the retry."""
+    await lease.async_suspend()
+    await api_manager.async_shutdown()
+
+
+def _polling_options(api_data: dict) -> tuple[dict[str, int], float | None, int]:
+    """Tier intervals, adaptive threshold (None when off) and adaptive ceiling of the entry."""
+    intervals = {
+        TIER_FAST: int(api_data.get(INTERVAL_FAST, UPDATE_INTERVAL_FAST)),
+        TIER_NORMAL: int(api_data.get(DELAY_TIME, UPDATE_INTERVAL_NORMAL)),
+        TIER_SLOW: int(api_data.get(INTERVAL_SLOW, UPDATE_INTERVAL_SLOW)),
+    }
+    adaptive_threshold = None
+    if api_data.get(ADAPTIVE_POLLING, False):
+        adaptive_threshold = float(api_data.get(ADAPTIVE_THRESHOLD, ADAPTIVE_THRESHOLD_DEFAULT))
+
+    return intervals, adaptive_threshold, int(api_data.get(INTERVAL_MAX, ADAPTIVE_INTERVAL_MAX))
+
+
+def _event_service(sse: dict) -> dict:
+    """Part of the check_sse_support() result kept in the entry."""
+    return {
+        "sse_uri": sse["sse_uri"] if sse["supports_sse"] else None,
+        "subscription_supported": sse["subscription_supported"],
+    }
+
+
+@callback
+def _store_capabilities(hass: HomeAssistant, config_entry: ConfigEntry, api: RedfishApihub) -> None:
+    """Persist the capabilities, so a rejected $select/$expand stays off after a restart."""
+    info = {**config_entry.data["info"], "Capabilities": dict(api.capabilities)}
+    hass.config_entries.async_update_entry(config_entry, data={**config_entry.data, "info": info})
+
+
+async def _async_revalidate_discovery(hass: HomeAssistant, config_entry: ConfigEntry, api: RedfishApihub, api_manager: ApiRequestManager) -> None:
+    """Rediscover the entry in the background, storing (and reloading) only if it changed.
+
+    Every part whose read fails keeps its stored value: a transient error must not
+    look like removed hardware or a lost EventService.
+    """
+    info = dict(config_entry.data["info"])
+
+    try:
+        # refreshes api.capabilities from the service root
+        await api_manager.request(api.getServiceTag, priority=PRIORITY_LOW, timeout=REQUEST_TIMEOUT_DEFAULT)
+        info["Capabilities"] = dict(api.capabilities)
+    except Exception as err:
+        _LOGGER.debug("iDRAC %s: service root not revalidated: %s", api.ip, err)
+
+    members = []
+    for member in info["Members"]:
+        member = dict(member)
+        if member.get("enable", True):
+            known = member.get("DeviceSensor", {}).get("TemperatureSensor", [])
+            try:
+                member.update(
+                    await api_manager.request(api.getSystemInventory, member["id"], priority=PRIORITY_LOW, timeout=REQUEST_TIMEOUT_DEFAULT)
+                )
+            except Exception as err:
+                _LOGGER.debug("iDRAC %s: inventory of %s not revalidated: %s", api.ip, member["id"], err)
+            else:
+                if not member["DeviceSensor"]["TemperatureSensor"]:
+                    # host off, Thermal has no temperatures: keep the ones already known
+                    member["DeviceSensor"]["TemperatureSensor"] = known
+        members.append(member)
+    info["Members"] = members
+
+    try:
+        info["EventService"] = _event_service(
+            await api_manager.request(api.check_sse_support, priority=PRIORITY_LOW, timeout=REQUEST_TIMEOUT_DEFAULT)
+        )
+    except Exception as err:
+        _LOGGER.debug("iDRAC %s: EventService not revalidated: %s", api.ip, err)
+
+    if info != config_entry.data["info"]:
+        # the update listener re-creates the entities of the changed systems
+        _LOGGER.info("iDRAC %s: discovery changed", api.ip)
+        hass.config_entries.async_update_entry(config_entry, data={**config_entry.data, "info": info})
+
+
+async def async_migrate_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> bool:
+    """Migrate an old config entry."""
+    if config_entry.version > 2:
+        # downgraded from a future version
+        return False
+
+    if config_entry.version == 1:
+        # V2 adds DeviceInfo/DeviceSensor/SystemActions to every member, Capabilities and
+        # EventService to info; missing parts are discovered by the next setup
+        info = dict(config_entry.data["info"])
+        info["Members"] = [dict(member) for member in info.get("Members", [])]
+        info.setdefault("Capabilities", {})
+
+        hass.config_entries.async_update_entry(
+            config_entry, data={**config_entry.data, "info": info}, version=2, minor_version=1
+        )
+        _LOGGER.debug("Migrated iDRAC %s to config entry version 2", info.get("ServiceTag"))
 
     return True
 
@@ -56,14 +288,100 @@ async def async_unload_entry(hass: HomeAssistant, config_entry: ConfigEntry) ->
     )
     if unload_ok:
         # Clean up iDRAC connection
-        api = hass.data[DOMAIN].pop(config_entry.entry_id)
-        await hass.async_add_executor_job(api.__del__)
+        entry_data = hass.data[DOMAIN].pop(config_entry.entry_id)
+        if "event_listener" in entry_data:
+            await entry_data["event_listener"].async_stop()
+        if "event_subscription" in entry_data:
+            try:
+                await entry_data["api_manager"].request(entry_data["event_subscription"].async_unsubscribe, priority=PRIORITY_CRITICAL)
+            except Exception as err:
+                _LOGGER.warning("Failed to remove the iDRAC event subscription: %s", err)
+        if config_entry.disabled_by is None:
+            # reload or HA stop: the next setup resumes the stored session
+            await entry_data["session_lease"].async_suspend()
+        else:
+            await entry_data["session_lease"].async_release()
+        await entry_data["api_manager"].async_shutdown()
 
     return unload_ok
 
 
-async def async_reload_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> None:
-    """Reload a config entry when its data changes."""
-    _LOGGER.debug("Reloading iDRAC %s due to config changes", config_entry.data["info"]["ServiceTag"])
-    await async_unload_entry(hass, config_entry)
-    await async_setup_entry(hass, config_entry)
+async def async_remove_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> None:
+    """Log out and drop the stored session of a removed entry."""
+    try:
+        await async_remove_entry_session(hass, config_entry)
+    except Exception as err:
+        _LOGGER.debug("Failed to log out the session of a removed entry: %s", err)
+
+
+async def async_entry_updated(hass: HomeAssistant, config_entry: ConfigEntry) -> None:
+    """Apply a config entry change to the running setup.
+
+    Changes of the connection (host, credentials, parallel requests) or of the
+    EventService push path reload the entry. Everything else keeps the live session:
+    polling options reschedule the coordinator, enabled or rediscovered systems only
+    get their own entities added or removed.
+    """
+    entry_data = hass.data[DOMAIN][config_entry.entry_id]
+    api: RedfishApihub = entry_data["api"]
+    api_manager: ApiRequestManager = entry_data["api_manager"]
+    coordinator: IdracCoordinator = entry_data["coordinator"]
+
+    old = entry_data["applied"]
+    new = copy.deepcopy(dict(config_entry.data))
+    if new == old:
+        return
+
+    connection_keys = (CONF_HOST, CONF_USERNAME, CONF_PASSWORD, MAX_CONCURRENT)
+    if (
+        any(old["authdata"].get(key) != new["authdata"].get(key) for key in connection_keys)
+        or old["info"].get("EventService") != new["info"].get("EventService")
+    ):
+        _LOGGER.debug("Reloading iDRAC %s due to connection changes", new["info"]["ServiceTag"])
+        await hass.config_entries.async_reload(config_entry.entry_id)
+        return
+
+    # newly enabled systems that were never discovered
+    undiscovered = [
+        member for member in new["info"]["Members"] if member.get("enable", True) and "DeviceSensor" not in member
+    ]
+    for member in undiscovered:
+        try:
+            member.update(
+                await api_manager.request(api.getSystemInventory, member["id"], priority=PRIORITY_LOW, timeout=REQUEST_TIMEOUT_DEFAULT)
+            )
+        except Exception as err:
+            _LOGGER.warning("iDRAC %s: discovery of %s failed, reloading: %s", api.ip, member["id"], err)
+            await hass.config_entries.async_reload(config_entry.entry_id)
+            return
+
+    entry_data["applied"] = new
+    if undiscovered:
+        # re-enters this listener with nothing left to apply
+        hass.config_entries.async_update_entry(config_entry, data=new)
+
+    api.capabilities.update(new["info"].get("Capabilities", {}))
+    coordinator.async_set_intervals(*_polling_options(new["authdata"]))
+
+    old_members = {member["id"]: member for member in old["info"]["Members"] if member.get("enable", True)}
+    new_members = {member["id"]: member for member in new["info"]["Members"] if member.get("enable", True)}
+
+    # disabled systems, and systems whose inventory changed (re-added below with the same unique ids)
+    stale = [system for system, member in old_members.items() if new_members.get(system) != member]
+    fresh = [member for system, member in new_members.items() if old_members.get(system) != member]
+
+    for system in stale:
+        await coordinator.async_remove_system_entities(system)
+
+    await coordinator.async_set_systems(list(new_members))
+
+    for member in fresh:
+        for async_add_system in coordinator.system_adders:
+            await async_add_system(member)
+
+    _LOGGER.debug(
+        "iDRAC %s options applied without reload: %d systems removed, %d added",
+        new["info"]["ServiceTag"],
+        len(stale),
+        len(fresh),
+    )
@@ -1,7 +1,9 @@
 """API request manager for iDRAC Redfish integration."""
 
 import asyncio
+import itertools
 import logging
+import time
 from collections.abc import Callable
 from datetime import datetime, timedelta
 from typing import Any
@@ -13,6 +15,7 @@ from .const import (
     MAX_CONCURRENT_REQUESTS,
     MAX_RETRIES,
     MIN_TIME_BETWEEN_REQUESTS,
+    PRIORITY_AGING_SECONDS,
     PRIORITY_CRITICAL,
     RETRY_BACKOFF_FACTOR,
     RETRY_STATUSES,
@@ -22,16 +25,25 @@ _LOGGER = logging.getLogger(__name__)
 
 
 class ApiRequestManager:
-    """Manage API requests with rate limiting and retry logic."""
+    """Manage API requests with priority scheduling, rate limiting and retry logic."""
 
-    def __init__(self, hass: HomeAssistant) -> None:
+    def __init__(self, hass: HomeAssistant, max_concurrent: int = MAX_CONCURRENT_REQUESTS) -> None:
         """Initialize the API request manager."""
         self.hass = hass
         self._last_request_time: datetime | None = None
         self._request_lock = asyncio.Lock()
-        self._semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+        self._semaphore = asyncio.Semaphore(max(1, int(max_concurrent)))
         self._request_queue: asyncio.PriorityQueue = asyncio.PriorityQueue()
         self._queue_task: asyncio.Task | None = None
+        self._sequence = itertools.count()
+
+        # counters, exposed through diagnostics
+        self.stats: dict[str, int | float] = {
+            "requests": 0,
+            "retried": 0,
+            "failed": 0,
+            "queued_seconds": 0.0,
+        }
 
     async def request(
         self,
@@ -39,73 +51,164 @@ class ApiRequestManager:
         *args: Any,
         priority: int = PRIORITY_CRITICAL,
         timeout: int = 20,
+        retries: int = MAX_RETRIES,
         **kwargs: Any,
     ) -> Any:
-        """Execute an API request with rate limiting and retry logic.
+        """Queue an API request and wait for its result.
+
+        Requests are dispatched in priority order as slots free up. The sort key
+        ages with the time a request has waited (PRIORITY_AGING_SECONDS per
+        priority level), so low priority work is delayed but never starved.
 
         Args:
             func: The async function to call
             *args: Positional arguments for the function
             priority: Request priority (lower = higher priority)
             timeout: Request timeout in seconds
+            retries: Attempts on timeout or retryable status, 1 for non idempotent
+                calls (power actions, session and subscription creation) whose
+                first attempt may have been applied even though it timed out
             **kwargs: Keyword arguments for the function
         """
-        async with self._semaphore:
-            # Rate limiting
-            async with self._request_lock:
-                if self._last_request_time:
-                    elapsed = (datetime.now() - self._last_request_time).total_seconds()
-                    if elapsed < MIN_TIME_BETWEEN_REQUESTS:
-                        await asyncio.sleep(MIN_TIME_BETWEEN_REQUESTS - elapsed)
-                self._last_request_time = datetime.now()
-
-            # Retry logic with exponential backoff
-            last_exception = None
-            for attempt in range(MAX_RETRIES):
-                try:
-                    result = await asyncio.wait_for(
-                        func(*args, **kwargs),
-                        timeout=timeout
+        queued_at = time.monotonic()
+        future: asyncio.Future = self.hass.loop.create_future()
+
+        sort_key = queued_at + priority * PRIORITY_AGING_SECONDS
+        self._request_queue.put_nowait(
+            (sort_key, next(self._sequence), queued_at, future, func, args, kwargs, timeout, retries)
+        )
+
+        if self._queue_task is None or self._queue_task.done():
+            self._queue_task = self.hass.async_create_background_task(
+                self._dispatch(), name="HA_idrac7_redfish request dispatcher"
+            )
+
+        return await future
+
+    async def _dispatch(self) -> None:
+        """Hand queued requests to free slots, most urgent sort key first."""
+        while True:
+            await self._semaphore.acquire()
+            try:
+                _, _, queued_at, future, func, args, kwargs, timeout, retries = await self._request_queue.get()
+            except asyncio.CancelledError:
+                self._semaphore.release()
+                raise
+
+            if future.done():
+                # the caller went away while queued
+                self._semaphore.release()
+                continue
+
+            self.stats["queued_seconds"] += time.monotonic() - queued_at
+            self.hass.async_create_background_task(
+                self._run(future, func, args, kwargs, timeout, retries),
+                name="HA_idrac7_redfish request",
+            )
+
+    async def _run(
+        self,
+        future: asyncio.Future,
+        func: Callable,
+        args: tuple,
+        kwargs: dict,
+        timeout: int,
+        retries: int,
+    ) -> None:
+        """Run one dispatched request and release its slot."""
+        try:
+            result = await self._execute(func, args, kwargs, timeout, retries)
+        except Exception as ex:
+            # handed to the caller waiting on the future
+            if not future.done():
+                future.set_exception(ex)
+        else:
+            if not future.done():
+                future.set_result(result)
+        finally:
+            self._semaphore.release()
+
+    async def _execute(
+        self,
+        func: Callable,
+        args: tuple,
+        kwargs: dict,
+        timeout: int,
+        retries: int = MAX_RETRIES,
+    ) -> Any:
+        """Execute an API request with rate limiting and retry logic."""
+        # Rate limiting
+        async with self._request_lock:
+            if self._last_request_time:
+                elapsed = (datetime.now() - self._last_request_time).total_seconds()
+                if elapsed < MIN_TIME_BETWEEN_REQUESTS:
+                    await asyncio.sleep(MIN_TIME_BETWEEN_REQUESTS - elapsed)
+            self._last_request_time = datetime.now()
+
+        self.stats["requests"] += 1
+
+        # Retry logic with exponential backoff
+        last_exception = None
+        for attempt in range(retries):
+            try:
+                result = await asyncio.wait_for(
+                    func(*args, **kwargs),
+                    timeout=timeout
+                )
+                return result
+            except asyncio.TimeoutError as ex:
+                last_exception = ex
+                if attempt < retries - 1:
+                    self.stats["retried"] += 1
+                    wait_time = RETRY_BACKOFF_FACTOR ** attempt
+                    _LOGGER.warning(
+                        "Request timeout (attempt %d/%d), retrying in %ds",
+                        attempt + 1,
+                        retries,
+                        wait_time,
                     )
-                    return result
-                except asyncio.TimeoutError as ex:
-                    last_exception = ex
-                    if attempt < MAX_RETRIES - 1:
+                    await asyncio.sleep(wait_time)
+                else:
+                    _LOGGER.error("Request failed after %d attempts", retries)
+            except Exception as ex:
+                last_exception = ex
+                # Check if it's a retryable HTTP error
+                if hasattr(ex, "status") and ex.status in RETRY_STATUSES:
+                    if attempt < retries - 1:
+                        self.stats["retried"] += 1
                         wait_time = RETRY_BACKOFF_FACTOR ** attempt
                         _LOGGER.warning(
-                            "Request timeout (attempt %d/%d), retrying in %ds",
+                            "API error %s (attempt %d/%d), retrying in %ds: %s",
+                            ex.status if hasattr(ex, "status") else "unknown",
                             attempt + 1,
-                            MAX_RETRIES,
+                            retries,
                             wait_time,
+                            ex,
                         )
                         await asyncio.sleep(wait_time)
                     else:
-                        _LOGGER.error("Request failed after %d attempts", MAX_RETRIES)
-                except Exception as ex:
-                    last_exception = ex
-                    # Check if it's a retryable HTTP error
-                    if hasattr(ex, "status") and ex.status in RETRY_STATUSES:
-                        if attempt < MAX_RETRIES - 1:
-                            wait_time = RETRY_BACKOFF_FACTOR ** attempt
-                            _LOGGER.warning(
-                                "API error %s (attempt %d/%d), retrying in %ds: %s",
-                                ex.status if hasattr(ex, "status") else "unknown",
-                                attempt + 1,
-                                MAX_RETRIES,
-                                wait_time,
-                                ex,
-                            )
-                            await asyncio.sleep(wait_time)
-                        else:
-                            _LOGGER.error("Request failed after %d attempts", MAX_RETRIES)
-                    else:
-                        # Non-retryable error, raise immediately
-                        raise
+                        _LOGGER.error("Request failed after %d attempts", retries)
+                else:
+                    # Non-retryable error, raise immediately
+                    self.stats["failed"] += 1
+                    raise
+
+        # All retries failed
+        self.stats["failed"] += 1
+        raise HomeAssistantError(
+            f"API request failed after {retries} attempts"
+        ) from last_exception
+
+    async def async_shutdown(self) -> None:
+        """Stop the dispatcher and fail requests still waiting in the queue."""
+        if self._queue_task is not None:
+            self._queue_task.cancel()
+            self._queue_task = None
 
-            # All retries failed
-            raise HomeAssistantError(
-                f"API request failed after {MAX_RETRIES} attempts"
-            ) from last_exception
+        while not self._request_queue.empty():
+            future = self._request_queue.get_nowait()[3]
+            if not future.done():
+                future.set_exception(HomeAssistantError("API request manager stopped"))
 
     async def batch_request(
         self,
@@ -13,10 +13,13 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 
 # local import
-from .const import DELAY_TIME, DOMAIN
+from .api_manager import ApiRequestManager
+from .coordinator import IdracCoordinator
+from .const import DELAY_TIME, DOMAIN, HEALTH, POWER_STATE
 from .RedfishApi import RedfishApihub
-from .type_sensor.binary_sensor.Server_Power_status import PowerStatusBinarySensor,PowerStatusCoordinator
-from .type_sensor.binary_sensor.Server_health_status import HealthStatusBinarySensor, HealthStatusCoordinator
+from .type_sensor.binary_sensor.Server_Power_status import PowerStatusBinarySensor
+from .type_sensor.binary_sensor.Server_health_status import HealthStatusBinarySensor
+from .type_sensor.sensor.SensorKey import SensorKey
 
 
 
@@ -25,7 +28,9 @@ _LOGGER = logging.getLogger(__name__)
 
 async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry, async_add_entities: AddEntitiesCallback) -> None:
     """Set up entry."""
-    api : RedfishApihub = hass.data[DOMAIN][config_entry.entry_id]
+    api : RedfishApihub = hass.data[DOMAIN][config_entry.entry_id]["api"]
+    api_manager : ApiRequestManager = hass.data[DOMAIN][config_entry.entry_id]["api_manager"]
+    coordinator : IdracCoordinator = hass.data[DOMAIN][config_entry.entry_id]["coordinator"]
 
     # Get embedded systems and their status from config_entry data
     config_data = config_entry.data
@@ -43,15 +48,21 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry, asyn
 
     # nel for, per ogni embbeddded system get System.Embedded.info
     # setto i sensori dell'embedded system
+    async def async_add_system(EmbSys: dict) -> None:
+        infoSingleSystem['id'] = EmbSys['id']
+        _LOGGER.info("form Server: %s   setup binary_sensor for: %s", service_tag, EmbSys['id'])
+        await setup_Embedded_System_entry(hass= hass, api= api, api_manager= api_manager, coordinator= coordinator, async_add_entities= coordinator.track_entities(EmbSys['id'], async_add_entities), infoSingleSystem= dict(infoSingleSystem), member= EmbSys)
+
+    # also used when a system gets enabled from the options
+    coordinator.system_adders.append(async_add_system)
+
     for EmbSys in embedded_systems:
         # Skip disabled embedded systems
         if not EmbSys.get("enable", True):
             _LOGGER.debug("Skipping disabled system: %s", EmbSys['id'])
             continue
 
-        infoSingleSystem['id'] = EmbSys['id']
-        _LOGGER.info("form Server: %s   setup binary_sensor for: %s", service_tag, EmbSys['id'])
-        await setup_Embedded_System_entry(hass= hass, api= api, async_add_entities= async_add_entities, infoSingleSystem= infoSingleSystem)
+        await async_add_system(EmbSys)
 
 
 
@@ -68,9 +79,10 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry, asyn
 
 
 #setup entry for Embedded System
-async def setup_Embedded_System_entry(hass: HomeAssistant, api : RedfishApihub, async_add_entities: AddEntitiesCallback, infoSingleSystem : dict):
+async def setup_Embedded_System_entry(hass: HomeAssistant, api : RedfishApihub, api_manager : ApiRequestManager, coordinator : IdracCoordinator, async_add_entities: AddEntitiesCallback, infoSingleSystem : dict, member : dict):
     """Set up binary sensors for an embedded system."""
-    EmbSysInfo = await hass.async_add_executor_job(api.getEmbSysInfo, infoSingleSystem['id'])
+    # discovered inventory stored in the entry, the coordinator's slow tier keeps the device registry current
+    EmbSysInfo = member["DeviceInfo"]
     _LOGGER.debug("Setting up device: %s_%s", infoSingleSystem['ServiceTag'], infoSingleSystem['id'])
 
     device_info = DeviceInfo(
@@ -82,27 +94,20 @@ async def setup_Embedded_System_entry(hass: HomeAssistant, api : RedfishApihub,
         serial_number=infoSingleSystem['ServiceTag']
     )
 
-    coordinator = PowerStatusCoordinator(hass, api)
-    coordinator2 = HealthStatusCoordinator(hass, api, infoSingleSystem['PullingTime'])
-
     async_add_entities(
         [
-            PowerStatusBinarySensor(coordinator, infoSingleSystem['id'], device_info, infoSingleSystem),
-            HealthStatusBinarySensor(coordinator2, infoSingleSystem['id'], device_info, infoSingleSystem)
-        ],
-        True
+            PowerStatusBinarySensor(coordinator, SensorKey(POWER_STATE, infoSingleSystem['id'], infoSingleSystem['id']), device_info, infoSingleSystem),
+            HealthStatusBinarySensor(coordinator, SensorKey(HEALTH, infoSingleSystem['id'], infoSingleSystem['id']), device_info, infoSingleSystem)
+        ]
     )
 
-    await coordinator.async_config_entry_first_refresh()
-    await coordinator2.async_config_entry_first_refresh()
-
     return True
 
 
 #setup entry for iDrac Managers
 async def setup_iDrac_Managers_entry(hass: HomeAssistant, api : RedfishApihub, async_add_entities: AddEntitiesCallback, infoSingleSystem : dict):
     """Set up binary sensors for an iDRAC manager."""
-    EmbSysInfo = await hass.async_add_executor_job(api.getEmbeddedManagers, infoSingleSystem['id'])
+    EmbSysInfo = await api.getEmbeddedManagers(infoSingleSystem['id'])
     device_info = DeviceInfo(
         identifiers={(DOMAIN, f"{infoSingleSystem['ServiceTag']}_{infoSingleSystem['id']}")},
         name=EmbSysInfo["name"],
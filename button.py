@@ -11,6 +11,8 @@ from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 # local import
+from .api_manager import ApiRequestManager
+from .coordinator import IdracCoordinator
 from .const import DELAY_TIME, DOMAIN
 from .RedfishApi import RedfishApihub
 from .type_sensor.button.Server_power_button import ServerPowerButton
@@ -20,7 +22,9 @@ _LOGGER = logging.getLogger(__name__)
 
 async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry, async_add_entities: AddEntitiesCallback) -> None:
     """Set up entry."""
-    api : RedfishApihub = hass.data[DOMAIN][config_entry.entry_id]
+    api : RedfishApihub = hass.data[DOMAIN][config_entry.entry_id]["api"]
+    api_manager : ApiRequestManager = hass.data[DOMAIN][config_entry.entry_id]["api_manager"]
+    coordinator : IdracCoordinator = hass.data[DOMAIN][config_entry.entry_id]["coordinator"]
 
     # Get embedded systems and their status from config_entry data
     config_data = config_entry.data
@@ -38,15 +42,21 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry, asyn
 
     # nel for, per ogni embbeddded system get System.Embedded.info
     # setto i sensori dell'embedded system
+    async def async_add_system(EmbSys: dict) -> None:
+        infoSingleSystem['id'] = EmbSys['id']
+        _LOGGER.info("form Server: %s   setup button for: %s", service_tag, EmbSys['id'])
+        await setup_Embedded_System_entry(hass= hass, api= api, api_manager= api_manager, coordinator= coordinator, async_add_entities= coordinator.track_entities(EmbSys['id'], async_add_entities), infoSingleSystem= dict(infoSingleSystem), member= EmbSys)
+
+    # also used when a system gets enabled from the options
+    coordinator.system_adders.append(async_add_system)
+
     for EmbSys in embedded_systems:
         # Skip disabled embedded systems
         if not EmbSys.get("enable", True):
             _LOGGER.debug("Skipping disabled system: %s", EmbSys['id'])
             continue
 
-        infoSingleSystem['id'] = EmbSys['id']
-        _LOGGER.info("form Server: %s   setup button for: %s", service_tag, EmbSys['id'])
-        await setup_Embedded_System_entry(hass= hass, api= api, async_add_entities= async_add_entities, infoSingleSystem= infoSingleSystem)
+        await async_add_system(EmbSys)
 
 
 
@@ -62,9 +72,10 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry, asyn
     return None
 
 
-async def setup_Embedded_System_entry(hass: HomeAssistant, api: RedfishApihub, async_add_entities: AddEntitiesCallback, infoSingleSystem: dict):
+async def setup_Embedded_System_entry(hass: HomeAssistant, api: RedfishApihub, api_manager: ApiRequestManager, coordinator: IdracCoordinator, async_add_entities: AddEntitiesCallback, infoSingleSystem: dict, member: dict):
     """Set up button entities for an embedded system."""
-    EmbSysInfo = await hass.async_add_executor_job(api.getEmbSysInfo, infoSingleSystem['id'])
+    # discovered inventory stored in the entry, the coordinator's slow tier keeps the device registry current
+    EmbSysInfo = member["DeviceInfo"]
     _LOGGER.info("Setting up buttons for device: %s_%s", infoSingleSystem['ServiceTag'], infoSingleSystem['id'])
 
     device_info = DeviceInfo(
@@ -76,7 +87,7 @@ async def setup_Embedded_System_entry(hass: HomeAssistant, api: RedfishApihub, a
         serial_number=infoSingleSystem['ServiceTag']
     )
 
-    EmbSysPowerActions = await hass.async_add_executor_job(api.getEmbSysPowerActions, infoSingleSystem['id'])
+    EmbSysPowerActions = member["SystemActions"]["PowerAction"]
     _LOGGER.info("Supported power functions: %s", EmbSysPowerActions)
 
     power_button_list = []
@@ -88,6 +99,7 @@ async def setup_Embedded_System_entry(hass: HomeAssistant, api: RedfishApihub, a
             power_button_list.append(ServerPowerButton(
                 hass=hass,
                 api=api,
+                api_manager=api_manager,
                 device_info=device_info,
                 infoSingleSystem=info
             ))
@@ -17,10 +17,26 @@ from homeassistant.config_entries import ConfigFlow, ConfigFlowResult, OptionsFl
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.const import CONF_HOST, CONF_PASSWORD, CONF_USERNAME, CONF_DELAY
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.selector import BooleanSelector
 
 from .RedfishApi import RedfishApihub
-from .const import DELAY_TIME, DOMAIN
+from .const import (
+    ADAPTIVE_INTERVAL_MAX,
+    ADAPTIVE_POLLING,
+    ADAPTIVE_THRESHOLD,
+    ADAPTIVE_THRESHOLD_DEFAULT,
+    DELAY_TIME,
+    DOMAIN,
+    FLOW_HANDOFF,
+    INTERVAL_FAST,
+    INTERVAL_MAX,
+    INTERVAL_SLOW,
+    MAX_CONCURRENT,
+    MAX_CONCURRENT_REQUESTS,
+    UPDATE_INTERVAL_FAST,
+    UPDATE_INTERVAL_SLOW,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -45,7 +61,7 @@ STEP_USER_DATA_SCHEMA = vol.Schema(
 class RedfishIdracConfigFlow(ConfigFlow, domain=DOMAIN):
     """Handle a config flow for HA_idrac7_redfish."""
 
-    VERSION = 1
+    VERSION = 2
     MINOR_VERSION = 1
 
     def __init__(self) -> None:
@@ -55,6 +71,10 @@ class RedfishIdracConfigFlow(ConfigFlow, domain=DOMAIN):
         self.EmbeddedSystem_list: list[dict[str, Any]] = []
         self.iDrac_list: list[dict[str, Any]] = []
         self.service_tag: str = ""
+        self.capabilities: dict[str, bool] = {}
+
+        # authenticated hub of the validation, handed to the first setup of the entry
+        self._hub: RedfishApihub | None = None
 
     async def async_step_user(self, user_input: dict[str, Any] | None = None) -> ConfigFlowResult:
         """Handle the initial step."""
@@ -64,7 +84,7 @@ class RedfishIdracConfigFlow(ConfigFlow, domain=DOMAIN):
         if user_input is not None:
             info: dict[str, Any] = {}
             try:
-                info = await validate_input(self.hass, user_input)
+                info = await validate_input(self.hass, user_input, keep_session=True)
 
             except RetriesExhaustedError:
                 _LOGGER.exception("Name server: [%s] Retries Exhausted: maybe the server is unreachable", user_input[CONF_HOST])
@@ -90,6 +110,8 @@ class RedfishIdracConfigFlow(ConfigFlow, domain=DOMAIN):
             else:
                 assert info is not None
 
+                self._hub = info["hub"]
+
                 # If already configured
                 if await self.api_alias_already_configured(info):
                     return self.async_abort(reason="already_configured")
@@ -99,6 +121,7 @@ class RedfishIdracConfigFlow(ConfigFlow, domain=DOMAIN):
                 self.EmbeddedSystem_list = info["info"].get("Members", [])
                 self.iDrac_list = info["info"].get("Managers", [])
                 self.service_tag = info["info"].get("ServiceTag", "")
+                self.capabilities = info["info"].get("Capabilities", {})
 
                 # Proceed to embedded systems configuration
                 return await self.async_step_embsys()
@@ -126,10 +149,18 @@ class RedfishIdracConfigFlow(ConfigFlow, domain=DOMAIN):
                 "info": {
                     "ServiceTag": self.service_tag,
                     "Members": self.EmbeddedSystem_list,
-                    "Managers": self.iDrac_list
+                    "Managers": self.iDrac_list,
+                    "Capabilities": self.capabilities,
                 }
             }
 
+            # discover the enabled systems with the validated session, so the first setup needs no discovery
+            await self._async_discover(config_data["info"])
+
+            # the first setup adopts the session instead of logging in again
+            self.hass.data.setdefault(DOMAIN, {}).setdefault(FLOW_HANDOFF, {})[self.service_tag] = self._hub
+            self._hub = None
+
             # Include the iDRAC host IP in the entry title
             entry_title = f"{self.service_tag} ({self.Redfish_config[CONF_HOST]})"
 
@@ -149,6 +180,31 @@ class RedfishIdracConfigFlow(ConfigFlow, domain=DOMAIN):
             description_placeholders={"service_tag": self.service_tag}
         )
 
+    async def _async_discover(self, info: dict[str, Any]) -> None:
+        """Add the V2 inventory of the enabled systems and the EventService probe to info.
+
+        A failure only leaves the parts out, the setup discovers whatever is missing.
+        """
+        try:
+            for system in info["Members"]:
+                if system.get("enable", True):
+                    system.update(await self._hub.getSystemInventory(system["id"]))
+
+            sse = await self._hub.check_sse_support()
+            info["EventService"] = {
+                "sse_uri": sse["sse_uri"] if sse["supports_sse"] else None,
+                "subscription_supported": sse["subscription_supported"],
+            }
+        except Exception as err:
+            _LOGGER.debug("Discovery left to the setup of %s: %s", self.service_tag, err)
+
+    @callback
+    def async_remove(self) -> None:
+        """Close the validation session of a flow that did not create an entry."""
+        if self._hub is not None:
+            self.hass.async_create_task(self._hub.logout())
+            self._hub = None
+
     def _update_manager_status(self) -> None:
         """Update manager status based on enabled embedded systems."""
         # Create a mapping from system to manager ID
@@ -229,9 +285,11 @@ class OptionsFlowHandler(OptionsFlowWithConfigEntry):
         errors: dict[str, str] = {}
 
         if user_input is not None:
-            # Test new credentials
+            auth_data = self.config_entry.data.get("authdata", self.config_entry.data)
             try:
-                await validate_input(self.hass, user_input)
+                # Test new credentials: a login to the iDRAC, not needed for polling options alone
+                if any(user_input.get(key) != auth_data.get(key) for key in (CONF_HOST, CONF_USERNAME, CONF_PASSWORD)):
+                    await validate_input(self.hass, user_input)
             except RetriesExhaustedError:
                 errors["base"] = "retries_exhausted"
             except ServerDownOrUnreachableError:
@@ -247,20 +305,18 @@ class OptionsFlowHandler(OptionsFlowWithConfigEntry):
                 # Update config entry with new credentials
                 new_data = {**self.config_entry.data}
 
-                # Update auth data in the nested structure
+                # Update auth data in the nested structure (copied, the entry must see a change)
                 if "authdata" in new_data:
-                    new_data["authdata"].update(user_input)
+                    new_data["authdata"] = {**new_data["authdata"], **user_input}
                 else:
                     # Flat structure - update directly
                     new_data.update(user_input)
 
+                # the update listener applies the change, reloading only if the session is affected
                 self.hass.config_entries.async_update_entry(
                     self.config_entry, data=new_data
                 )
 
-                # Trigger reload of the integration
-                await self.hass.config_entries.async_reload(self.config_entry.entry_id)
-
                 return self.async_create_entry(title="", data={})
 
         # Get current credentials
@@ -280,6 +336,30 @@ class OptionsFlowHandler(OptionsFlowWithConfigEntry):
                 DELAY_TIME,
                 default=auth_data.get(DELAY_TIME, "30")
             ): str,
+            vol.Optional(
+                INTERVAL_FAST,
+                default=int(auth_data.get(INTERVAL_FAST, UPDATE_INTERVAL_FAST))
+            ): vol.All(vol.Coerce(int), vol.Range(min=5)),
+            vol.Optional(
+                INTERVAL_SLOW,
+                default=int(auth_data.get(INTERVAL_SLOW, UPDATE_INTERVAL_SLOW))
+            ): vol.All(vol.Coerce(int), vol.Range(min=60)),
+            vol.Optional(
+                MAX_CONCURRENT,
+                default=int(auth_data.get(MAX_CONCURRENT, MAX_CONCURRENT_REQUESTS))
+            ): vol.All(vol.Coerce(int), vol.Range(min=1, max=8)),
+            vol.Optional(
+                ADAPTIVE_POLLING,
+                default=auth_data.get(ADAPTIVE_POLLING, False)
+            ): BooleanSelector(),
+            vol.Optional(
+                ADAPTIVE_THRESHOLD,
+                default=float(auth_data.get(ADAPTIVE_THRESHOLD, ADAPTIVE_THRESHOLD_DEFAULT))
+            ): vol.All(vol.Coerce(float), vol.Range(min=0.1, max=100)),
+            vol.Optional(
+                INTERVAL_MAX,
+                default=int(auth_data.get(INTERVAL_MAX, ADAPTIVE_INTERVAL_MAX))
+            ): vol.All(vol.Coerce(int), vol.Range(min=30)),
         })
 
         return self.async_show_form(
@@ -302,6 +382,7 @@ class OptionsFlowHandler(OptionsFlowWithConfigEntry):
 
             # Update embedded systems configuration
             if "info" in new_data and "Members" in new_data["info"]:
+                new_data["info"] = dict(new_data["info"])
                 updated_systems = []
                 for system in new_data["info"]["Members"]:
                     updated_system = dict(system)
@@ -317,13 +398,11 @@ class OptionsFlowHandler(OptionsFlowWithConfigEntry):
                 new_data["info"]["Members"] = updated_systems
                 new_data["info"]["Managers"] = updated_managers
 
+            # the update listener adds or removes the entities of the toggled systems only
             self.hass.config_entries.async_update_entry(
                 self.config_entry, data=new_data
             )
 
-            # Trigger reload of the integration
-            await self.hass.config_entries.async_reload(self.config_entry.entry_id)
-
             return self.async_create_entry(title="", data={})
 
         # Create systems selection schema with better labels
@@ -355,19 +434,27 @@ class OptionsFlowHandler(OptionsFlowWithConfigEntry):
 #
 ##########################
 
-async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str, Any]:
+async def validate_input(hass: HomeAssistant, data: dict[str, Any], keep_session: bool = False) -> dict[str, Any]:
     """Validate the user input allows us to connect.
 
     Data has the keys from STEP_USER_DATA_SCHEMA with values provided by the user.
+    With keep_session the logged in hub is returned as "hub" instead of logged out.
     """
-    hub = RedfishApihub(data[CONF_HOST], data[CONF_USERNAME], data[CONF_PASSWORD])
-    info = await hass.async_add_executor_job(hub.getRedfishInfo)
+    hub = RedfishApihub(data[CONF_HOST], data[CONF_USERNAME], data[CONF_PASSWORD], async_get_clientsession(hass, verify_ssl=False))
+    try:
+        info = await hub.getRedfishInfo()
+    except Exception:
+        await hub.logout()
+        raise
 
     system_info = {}
     system_info["authdata"] = data
     system_info["info"] = info
 
-    await hass.async_add_executor_job(hub.__del__)
+    if keep_session:
+        system_info["hub"] = hub
+    else:
+        await hub.logout()
     return system_info
 
 
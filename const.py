@@ -18,6 +18,20 @@ DOMAIN = "HA_idrac7_redfish"
 #           }
 
 
+### V2 (current)
+# V1 plus the discovery of the last run, so a restart creates the entities without requests
+#  "info":
+#           {"ServiceTag": "xxxxx",
+#            'Capabilities': {'expand': bool, 'select': bool},
+#            'EventService': {'sse_uri': str | None, 'subscription_supported': bool},
+#            'Members':
+#                     [{'enable': True, 'id': 'System.Embedded.x',
+#                       'DeviceInfo': {'name': <HostName>, 'manufacturer': str, 'model': str, 'sw_version': <biosVersion>},
+#                       'DeviceSensor': {'fans': [fanID], 'TemperatureSensor': [sensorName], 'PSU': [psuID]},
+#                       'SystemActions': {'PowerAction': [resetType]} }],
+#            'Managers': [{'enable': False, 'id': 'iDRAC.Embedded.x'}] }
+
+
 #### idea V2
 # config entry.data example
 # questo e un esempio di cosa dovrebbe resistituire la funzione get_systems_info(DOMAIN: str)
@@ -95,9 +109,36 @@ model = "model"
 
 DELAY_TIME = 'time_delay'
 
+#User-Agent of every Redfish request, lets the startup sweep recognise this integration's sessions
+USER_AGENT = DOMAIN
+
+#HA storage version of the recorded session locations (session_lease.py)
+SESSION_STORAGE_VERSION = 1
+
+#hass.data[DOMAIN] key of the hubs a config flow hands to the first setup, by service tag
+FLOW_HANDOFF = 'flow_handoff'
+
+#per-host cap of parallel requests, defaults to MAX_CONCURRENT_REQUESTS
+MAX_CONCURRENT = 'max_concurrent_requests'
+
+#polling cadence of the fast and slow tiers, the normal tier uses DELAY_TIME
+INTERVAL_FAST = 'interval_fast'
+INTERVAL_SLOW = 'interval_slow'
+
+#adaptive normal tier: stretch the interval up to INTERVAL_MAX while readings stay within ADAPTIVE_THRESHOLD percent
+ADAPTIVE_POLLING = 'adaptive_polling'
+ADAPTIVE_THRESHOLD = 'adaptive_threshold'
+INTERVAL_MAX = 'interval_max'
+
 #Delay polling time
 SERVER_POWER_STATUS_POOL = 5
 
+#EventService push: fired on the HA bus for every Redfish event record received
+EVENT_REDFISH = DOMAIN + "_event"
+
+#one Systems/{id} read is shared by power, health and device info for this long
+SYSTEM_SNAPSHOT_MAX_AGE = SERVER_POWER_STATUS_POOL
+
 ##################################
 #
 #   API Request Management
@@ -118,12 +159,50 @@ UPDATE_INTERVAL_FAST = 30  # For critical data (power status, health)
 UPDATE_INTERVAL_NORMAL = 60  # For sensor data (temperature, fans)
 UPDATE_INTERVAL_SLOW = 300  # For static data (system info)
 
+# Resource cache of the hub, TTL (seconds) per resource class
+RESOURCE_CACHE_MAX_ENTRIES = 64
+RESOURCE_CACHE_TTL = {
+    "root": 3600,                          # service root: service tag, capabilities
+    "collection": 3600,                    # Systems and Managers member lists
+    "system": SYSTEM_SNAPSHOT_MAX_AGE,     # Systems/{id} snapshot: power state, health
+    "inventory": UPDATE_INTERVAL_SLOW,     # model, BIOS, reset types, CooledBy/PoweredBy
+}
+
+# EventService SSE listener
+SSE_READ_TIMEOUT = 900  # Reconnect a stream silent for this long
+SSE_RECONNECT_MIN = 5  # Reconnect backoff, doubles up to SSE_RECONNECT_MAX
+SSE_RECONNECT_MAX = 300
+SSE_STABLE_SECONDS = 60  # A stream up this long (or delivering data) resets the backoff
+PUSH_RECONCILE_INTERVAL = UPDATE_INTERVAL_SLOW  # Fast tier interval while events are pushed
+WEBHOOK_SILENCE_TIMEOUT = PUSH_RECONCILE_INTERVAL  # No webhook delivery for this long: poll again, check the subscription
+
+# Adaptive polling of the normal tier
+ADAPTIVE_THRESHOLD_DEFAULT = 5  # Percent change of any reading that restores the base interval
+ADAPTIVE_INTERVAL_MAX = 600  # Ceiling of the stretched interval
+ADAPTIVE_BACKOFF_FACTOR = 2  # Interval growth per stable normal tick
+
+# Polling tiers, each runs at its own cadence
+TIER_FAST = "fast"
+TIER_NORMAL = "normal"
+TIER_SLOW = "slow"
+
+# Tier of every coordinator fetch group
+RESOURCE_TIERS = {
+    "system": TIER_FAST,      # power state, health
+    "thermal": TIER_NORMAL,   # fans, temperatures
+    "power": TIER_NORMAL,     # PSU, consumption
+    "inventory": TIER_SLOW,   # model, BIOS version
+}
+
 # Priority levels for request queue
 PRIORITY_CRITICAL = 0  # Power actions, critical commands
 PRIORITY_HIGH = 1      # Status updates (power, health)
 PRIORITY_NORMAL = 2    # Sensor readings
 PRIORITY_LOW = 3       # Static info updates
 
+# A queued request gains one priority level for every this many seconds it waits
+PRIORITY_AGING_SECONDS = 10
+
 
 #TIMEOUT API request
 REQUEST_FOR_STATUS_POWER = 10  # Increased from 5
@@ -136,6 +215,9 @@ FANS = "Fan"
 WATTSENSOR = "Watt"
 TEMPERATURE = "Temp"
 PSU = "PSU"
+POWER_STATE = "PowerState"
+HEALTH = "Health"
+DEVICE_INFO = "DeviceInfo"
 
 #map sensor to api value
 TotalWattConsumption = "PowerConsumedWatts"
@@ -162,6 +244,8 @@ ChassisReset = Template("/redfish/v1/Chassis/$EmbeddedSystemID/Actions/Chassis.R
 #sensor Fans
 ChassisFans = Template('/redfish/v1/Chassis/$EmbeddedSystemID/Sensors/Fans/$FanID')
 
+#Power resource, inlines PowerSupplies[] and PowerControl[]
+ChassisPower = Template('/redfish/v1/Chassis/$EmbeddedSystemID/Power')
 #PowerConsumptions
 ChassisConsumptions = Template('/redfish/v1/Chassis/$EmbeddedSystemID/Power/PowerControl')
 #Sensor powerPSU
@@ -175,6 +259,12 @@ ChassisThermal = Template('/redfish/v1/Chassis/$EmbeddedSystemID/Sensors/Tempera
 #Managers
 ManagersGeneral = "/redfish/v1/Managers"
 
+#Sessions
+SessionsGeneral = "/redfish/v1/SessionService/Sessions"
+
+#EventService push subscriptions
+EventSubscriptions = "/redfish/v1/EventService/Subscriptions"
+
 #SetPowerStatus
 SetPowerStatus = Template("/redfish/v1/Systems/$EmbeddedSystemID/Actions/ComputerSystem.Reset")
 
@@ -1,119 +1,461 @@
 """Data update coordinator for iDRAC Redfish integration."""
 
+import asyncio
 import logging
+import time
+from collections.abc import Awaitable, Callable
 from datetime import timedelta
 
-from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from redfish.rest.v1 import InvalidCredentialsError
+
+from homeassistant.config_entries import ConfigEntry, ConfigEntryState
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import ConfigEntryAuthFailed, HomeAssistantError
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers.entity import Entity
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
 from .api_manager import ApiRequestManager
 from .const import (
+    ADAPTIVE_BACKOFF_FACTOR,
+    DEVICE_INFO,
     DOMAIN,
+    FANS,
+    HEALTH,
+    POWER_STATE,
     PRIORITY_HIGH,
+    PRIORITY_LOW,
     PRIORITY_NORMAL,
-    REQUEST_FOR_STATUS_HEALTH,
+    PSU,
+    PUSH_RECONCILE_INTERVAL,
     REQUEST_FOR_STATUS_POWER,
     REQUEST_SENSOR,
-    UPDATE_INTERVAL_FAST,
-    UPDATE_INTERVAL_NORMAL,
+    REQUEST_TIMEOUT_DEFAULT,
+    RESOURCE_TIERS,
+    TEMPERATURE,
+    TIER_FAST,
+    TIER_NORMAL,
+    TIER_SLOW,
+    WATTSENSOR,
 )
+from .RedfishApi import RedfishApihub
 
 _LOGGER = logging.getLogger(__name__)
 
+# sensor types served by the same Redfish read
+FETCH_GROUPS: dict[str, tuple[str, ...]] = {
+    "system": (POWER_STATE, HEALTH),
+    "thermal": (FANS, TEMPERATURE),
+    "power": (PSU, WATTSENSOR),
+}
+
+# groups Redfish only reports while the host is powered on
+HOST_ON_GROUPS = {"thermal", "power"}
+
+
+class IdracCoordinator(DataUpdateCoordinator):
+    """Single coordinator of an iDRAC, shared by the binary_sensor and sensor platforms.
+
+    Entities subscribe with a SensorKey context; every tick the coordinator plans one
+    combined fetch (one Redfish read per fetch group and embedded system) and stores
+    the result as {systemID: {sensorType: data}}, so each entity reads its own slice.
+
+    Fetch groups belong to a tier (RESOURCE_TIERS). The coordinator ticks at the
+    fastest tier interval and only reads the groups whose tier is due, the other
+    slices keep their last value.
 
-class IdracSystemCoordinator(DataUpdateCoordinator):
-    """Coordinator for system status (power, health)."""
+    While the last known PowerState of a system is not On, its HOST_ON_GROUPS are not
+    read (iDRAC hides those sensors) and their entities report unavailable; they are
+    read again in the same tick that sees the host power on.
+
+    With adaptive polling the normal tier interval doubles after every tick whose
+    readings moved less than the threshold, up to a ceiling, and drops back to the
+    configured interval as soon as one reading changes more than that.
+
+    While an EventService listener pushes events, power and health are refreshed on
+    each event and the fast tier only runs as a PUSH_RECONCILE_INTERVAL reconciliation.
+    """
 
     def __init__(
         self,
         hass: HomeAssistant,
         config_entry: ConfigEntry,
+        api: RedfishApihub,
         api_manager: ApiRequestManager,
-        client: Any,  # Replace with your actual client type
+        systems: list[str],
+        intervals: dict[str, int],
+        adaptive_threshold: float | None = None,
+        interval_max: int | None = None,
     ) -> None:
         """Initialize the coordinator."""
         super().__init__(
             hass,
             logger=_LOGGER,
-            name=f"{DOMAIN}_system",
-            update_interval=timedelta(seconds=UPDATE_INTERVAL_FAST),
+            name=f"{DOMAIN}_{config_entry.data['info']['ServiceTag']}",
+            update_interval=timedelta(seconds=min(intervals.values())),
             config_entry=config_entry,
+            # unchanged (304) reads produce equal data, do not wake the entities for them
+            always_update=False,
         )
+        self.api = api
         self.api_manager = api_manager
-        self.client = client
+        self.systems = systems
+
+        # tier -> seconds between reads, tier -> monotonic time of the next read
+        self.intervals = dict(intervals)
+        self._next_due: dict[str, float] = {}
+
+        # configured intervals, the effective normal interval moves between base and interval_max
+        self.base_intervals = dict(intervals)
+        self.adaptive_threshold = adaptive_threshold
+        self.interval_max = interval_max
+        self.push_active = False
+
+        # entities of each system and the platform callbacks creating them, for changes applied without a reload
+        self.system_entities: dict[str, list[Entity]] = {}
+        self.system_adders: list[Callable[[dict], Awaitable[None]]] = []
+
+    def _due_tiers(self) -> set[str]:
+        """Tiers whose cadence has elapsed (all of them on the first refresh)."""
+        now = time.monotonic()
+
+        # ticks may fire slightly early, accept one second of tolerance
+        return {tier for tier in self.intervals if now + 1 >= self._next_due.get(tier, 0)}
+
+    @staticmethod
+    def _is_on(data: dict) -> bool:
+        """Whether a system slice reports the host on (unknown counts as on)."""
+        state = data.get(POWER_STATE, {}).get("state")
+        return state is None or state == "On"
+
+    def host_on(self, system: str) -> bool:
+        """Whether the last known power state of an embedded system is On."""
+        return self._is_on((self.data or {}).get(system, {}))
+
+    def _wanted(self) -> dict[str, set[str]]:
+        """Map each embedded system to the fetch groups its listening entities need."""
+        listening_idx = set(self.async_contexts())
+
+        plan: dict[str, set[str]] = {}
+        if not listening_idx:
+            # first refresh, before any entity subscribed: read everything
+            plan = {system: set(FETCH_GROUPS) for system in self.systems}
+
+        for key in listening_idx:
+            for group, types in FETCH_GROUPS.items():
+                if key.type in types:
+                    plan.setdefault(key.system, set()).add(group)
+
+        return plan
+
+    def _plan(self, wanted: dict[str, set[str]], due: set[str]) -> dict[str, set[str]]:
+        """Keep the wanted groups whose tier is due, skipping host sensors of powered off systems."""
+        due_groups = {group for group, tier in RESOURCE_TIERS.items() if tier in due}
+
+        plan: dict[str, set[str]] = {}
+        for system, groups in wanted.items():
+            groups = groups & due_groups
+            if not self.host_on(system):
+                groups -= HOST_ON_GROUPS
+            if groups:
+                plan[system] = groups
+
+        return plan
 
     async def _async_update_data(self) -> dict:
-        """Fetch system status data."""
-        try:
-            # Use API manager for coordinated requests
-            power_status = await self.api_manager.request(
-                self.client.get_power_status,
-                priority=PRIORITY_HIGH,
-                timeout=REQUEST_FOR_STATUS_POWER,
-            )
+        """Fetch every due group of every system concurrently."""
+        due = self._due_tiers()
+        wanted = self._wanted()
+        plan = self._plan(wanted, due)
 
-            health_status = await self.api_manager.request(
-                self.client.get_health_status,
-                priority=PRIORITY_HIGH,
-                timeout=REQUEST_FOR_STATUS_HEALTH,
-            )
+        requests_before = self.api.stats["requests"]
+        saved_before = self.api.stats["session_checks_saved"]
 
-            return {
-                "power": power_status,
-                "health": health_status,
-            }
-        except Exception as err:
-            raise UpdateFailed(f"Error communicating with iDRAC: {err}") from err
+        # start from the last data, only the groups read this tick are replaced (or dropped on failure)
+        result: dict[str, dict] = {system: dict(data) for system, data in (self.data or {}).items()}
+        for system in plan:
+            result.setdefault(system, {})
 
+        reads = [
+            self._read(system, group, result[system])
+            for system, groups in plan.items()
+            for group in groups
+        ]
 
-class IdracSensorCoordinator(DataUpdateCoordinator):
-    """Coordinator for sensor data (temperature, fans, PSU)."""
+        outcomes = await asyncio.gather(*reads, return_exceptions=True)
 
-    def __init__(
-        self,
-        hass: HomeAssistant,
-        config_entry: ConfigEntry,
-        api_manager: ApiRequestManager,
-        client: Any,
-    ) -> None:
-        """Initialize the coordinator."""
-        super().__init__(
-            hass,
-            logger=_LOGGER,
-            name=f"{DOMAIN}_sensors",
-            update_interval=timedelta(seconds=UPDATE_INTERVAL_NORMAL),
-            config_entry=config_entry,
+        # host powered on since the last tick: read its sensors now instead of at the next normal tick
+        powered_on = [
+            system
+            for system in plan
+            if not self.host_on(system) and self._is_on(result[system])
+        ]
+        resumed = [
+            self._read(system, group, result[system])
+            for system in powered_on
+            for group in wanted.get(system, set()) & HOST_ON_GROUPS
+        ]
+        if resumed:
+            _LOGGER.debug("%s hosts powered on %s, resuming sensor reads", self.name, powered_on)
+            reads += resumed
+            outcomes += await asyncio.gather(*resumed, return_exceptions=True)
+
+        failed = [outcome for outcome in outcomes if isinstance(outcome, Exception)]
+        for err in failed:
+            if isinstance(err, InvalidCredentialsError):
+                # Raising ConfigEntryAuthFailed will cancel future updates
+                # and start a config flow with SOURCE_REAUTH (async_step_reauth)
+                raise ConfigEntryAuthFailed from err
+
+        if reads and len(failed) == len(reads):
+            raise UpdateFailed(f"Error communicating with iDRAC: {failed[0]}") from failed[0]
+
+        if TIER_SLOW in due:
+            # static data, read after the system group so it reuses the same snapshot
+            for system in self.systems:
+                try:
+                    await self._read(system, "inventory", result.setdefault(system, {}))
+                except InvalidCredentialsError as err:
+                    raise ConfigEntryAuthFailed from err
+                except Exception:
+                    # already logged, the previous inventory is kept until the next slow tick
+                    continue
+
+        if TIER_NORMAL in due and self.adaptive_threshold is not None:
+            # only systems whose sensors were read this tick: a powered off host carries
+            # its last readings over, which would look perfectly stable
+            sampled = [system for system, groups in plan.items() if groups & HOST_ON_GROUPS]
+            if sampled:
+                self._adapt_normal_interval(
+                    {system: (self.data or {}).get(system, {}) for system in sampled},
+                    {system: result[system] for system in sampled},
+                )
+
+        if powered_on and self.intervals[TIER_NORMAL] != self.base_intervals[TIER_NORMAL]:
+            # temperatures move fastest right after power on, drop any stretched interval
+            _LOGGER.debug("%s normal tier back to %ss after power on", self.name, self.base_intervals[TIER_NORMAL])
+            self.intervals[TIER_NORMAL] = self.base_intervals[TIER_NORMAL]
+            self._apply_intervals()
+
+        now = time.monotonic()
+        for tier in due:
+            self._next_due[tier] = now + self.intervals[tier]
+        if powered_on:
+            # the resumed reads count as this normal tick
+            self._next_due[TIER_NORMAL] = now + self.intervals[TIER_NORMAL]
+
+        _LOGGER.debug(
+            "%s poll cycle %s: %d reads, %d failed, %d requests sent, %d session checks saved",
+            self.name,
+            sorted(due),
+            len(reads),
+            len(failed),
+            self.api.stats["requests"] - requests_before,
+            self.api.stats["session_checks_saved"] - saved_before,
         )
-        self.api_manager = api_manager
-        self.client = client
+        return result
 
-    async def _async_update_data(self) -> dict:
-        """Fetch sensor data."""
-        try:
-            # Batch multiple sensor requests
-            requests = [
-                (self.client.get_temperature_sensors, (), {}),
-                (self.client.get_fan_sensors, (), {}),
-                (self.client.get_psu_sensors, (), {}),
-                (self.client.get_power_consumption, (), {}),
-            ]
-
-            results = await self.api_manager.batch_request(
-                requests,
-                timeout=REQUEST_SENSOR,
+    @staticmethod
+    def _readings(data: dict) -> dict[tuple[str, str], float]:
+        """Numeric fan, temperature and consumption readings of every system slice."""
+        readings: dict[tuple[str, str], float] = {}
+        for system, values in data.items():
+            sensors = {
+                **{(FANS, key): value for key, value in values.get(FANS, {}).items()},
+                **{(TEMPERATURE, key): value for key, value in values.get(TEMPERATURE, {}).items()},
+            }
+            if isinstance(values.get(WATTSENSOR), dict):
+                sensors[(WATTSENSOR, "PowerConsumedWatts")] = values[WATTSENSOR].get("PowerConsumedWatts")
+
+            for (sensor_type, key), value in sensors.items():
+                if isinstance(value, (int, float)):
+                    readings[(system, f"{sensor_type}/{key}")] = value
+
+        return readings
+
+    def _adapt_normal_interval(self, previous: dict, current: dict) -> None:
+        """Stretch the normal tier while readings are stable, restore it when they move."""
+        old = self._readings(previous)
+        new = self._readings(current)
+
+        changes = [
+            abs(value - old[key]) * 100 / max(abs(old[key]), 1)
+            for key, value in new.items()
+            if key in old
+        ]
+
+        base = self.base_intervals[TIER_NORMAL]
+        if not changes or max(changes) >= self.adaptive_threshold:
+            interval = base
+        else:
+            interval = min(self.intervals[TIER_NORMAL] * ADAPTIVE_BACKOFF_FACTOR, max(self.interval_max, base))
+
+        if interval != self.intervals[TIER_NORMAL]:
+            _LOGGER.debug(
+                "%s normal tier interval %ss -> %ss (max change %.1f%%)",
+                self.name,
+                self.intervals[TIER_NORMAL],
+                interval,
+                max(changes, default=0),
             )
+            self.intervals[TIER_NORMAL] = interval
+            self._apply_intervals()
 
-            # Check for exceptions in results
-            for i, result in enumerate(results):
-                if isinstance(result, Exception):
-                    _LOGGER.warning("Sensor request %d failed: %s", i, result)
+    @callback
+    def async_set_intervals(self, intervals: dict[str, int], adaptive_threshold: float | None, interval_max: int | None) -> None:
+        """Apply new tier intervals and adaptive settings in place."""
+        self.base_intervals = dict(intervals)
+        self.intervals = dict(intervals)
+        self.adaptive_threshold = adaptive_threshold
+        self.interval_max = interval_max
 
-            return {
-                "temperature": results[0] if not isinstance(results[0], Exception) else None,
-                "fans": results[1] if not isinstance(results[1], Exception) else None,
-                "psu": results[2] if not isinstance(results[2], Exception) else None,
-                "power": results[3] if not isinstance(results[3], Exception) else None,
-            }
+        if self.push_active:
+            self.intervals[TIER_FAST] = max(self.intervals[TIER_FAST], PUSH_RECONCILE_INTERVAL)
+
+        # next reads follow the new cadence
+        now = time.monotonic()
+        for tier, due in self._next_due.items():
+            self._next_due[tier] = min(due, now + self.intervals[tier])
+
+        self._apply_intervals()
+        self._schedule_refresh()
+
+    def track_entities(self, system: str, async_add_entities: AddEntitiesCallback) -> AddEntitiesCallback:
+        """Wrap a platform's async_add_entities, remembering which system each entity belongs to."""
+        def add(entities, update_before_add: bool = False) -> None:
+            entities = list(entities)
+            self.system_entities.setdefault(system, []).extend(entities)
+            async_add_entities(entities, update_before_add)
+
+        return add
+
+    async def async_remove_system_entities(self, system: str) -> None:
+        """Remove the entities of a system from HA (registry entries are kept, like a reload does)."""
+        for entity in self.system_entities.pop(system, []):
+            await entity.async_remove()
+
+    async def async_set_systems(self, systems: list[str]) -> None:
+        """Change the polled systems, reading every group of the new ones before their entities are added."""
+        added = [system for system in systems if system not in self.systems]
+        self.systems = list(systems)
+
+        data = {system: values for system, values in (self.data or {}).items() if system in systems}
+        for system in added:
+            data[system] = {}
+            for group in (*FETCH_GROUPS, "inventory"):
+                try:
+                    await self._read(system, group, data[system])
+                except InvalidCredentialsError as err:
+                    raise ConfigEntryAuthFailed from err
+                except Exception:
+                    # already logged, the next due tick retries
+                    continue
+
+        self.async_set_updated_data(data)
+
+    def _apply_intervals(self) -> None:
+        """Tick at the fastest effective tier interval."""
+        self.update_interval = timedelta(seconds=min(self.intervals.values()))
+
+    @callback
+    def set_push_active(self, active: bool) -> None:
+        """Slow the fast tier down to a reconciliation rate while events are pushed."""
+        if active == self.push_active:
+            return
+
+        self.push_active = active
+        base = self.base_intervals[TIER_FAST]
+        self.intervals[TIER_FAST] = max(base, PUSH_RECONCILE_INTERVAL) if active else base
+        self._apply_intervals()
+
+        if not active:
+            # the reconcile deadline may be minutes away: poll power and health right away
+            self._next_due[TIER_FAST] = 0
+            if self.config_entry.state is ConfigEntryState.LOADED:
+                # not while unloading, the request manager is going away
+                self.config_entry.async_create_background_task(
+                    self.hass, self.async_request_refresh(), f"{self.name} push off refresh"
+                )
+
+        _LOGGER.debug("%s event push %s, fast tier every %ss", self.name, "on" if active else "off", self.intervals[TIER_FAST])
+
+    async def async_push_update(self, systems: list[str] | None = None) -> None:
+        """Re-read power state and health right away after an event about these systems."""
+        for system in systems or self.systems:
+            self.api.invalidateSystemSnapshot(system)
+
+        self._next_due[TIER_FAST] = 0
+        await self.async_request_refresh()
+
+    async def _read(self, system: str, group: str, data: dict) -> None:
+        """Run one fetch group for one system and store it in the system slice."""
+        try:
+            if group == "system":
+                snapshot = await self.api_manager.request(
+                    self.api.getSystemSnapshot, system, priority=PRIORITY_HIGH, timeout=REQUEST_FOR_STATUS_POWER
+                )
+                data[POWER_STATE] = {"state": snapshot["PowerState"]}
+                data[HEALTH] = {"health": snapshot["Health"]}
+
+            elif group == "thermal":
+                resServer = await self.api_manager.request(
+                    self.api.getThermalSensors, system, priority=PRIORITY_NORMAL, timeout=REQUEST_SENSOR
+                )
+                data[FANS] = resServer[FANS]
+                data[TEMPERATURE] = resServer[TEMPERATURE]
+
+            elif group == "power":
+                resServer = await self.api_manager.request(
+                    self.api.getPowerSensors, system, priority=PRIORITY_NORMAL, timeout=REQUEST_SENSOR
+                )
+                data[PSU] = resServer[PSU]
+
+                if (resServer[WATTSENSOR] == 'None') or (resServer[WATTSENSOR] is None):
+                    data[WATTSENSOR] = 0
+                else:
+                    data[WATTSENSOR] = resServer[WATTSENSOR]
+
+            elif group == "inventory":
+                # the slow tier is what refreshes the hub's cached inventory
+                self.api.invalidateResources("inventory", system)
+                EmbSysInfo = await self.api_manager.request(
+                    self.api.getEmbSysInfo, system, priority=PRIORITY_LOW, timeout=REQUEST_TIMEOUT_DEFAULT
+                )
+                data[DEVICE_INFO] = EmbSysInfo
+                self._async_update_device(system, EmbSysInfo)
+
+        except (RuntimeError, asyncio.TimeoutError, HomeAssistantError) as err:
+            _LOGGER.error("Timeout update %s sensors of %s: %s", group, system, err)
+            self._drop_group(data, group)
+            raise
+        except InvalidCredentialsError:
+            raise
         except Exception as err:
-            raise UpdateFailed(f"Error fetching sensor data: {err}") from err
+            # PSU might not be available (server off, hot-swap), continue with other sensors
+            _LOGGER.error("Error reading %s sensors of %s: %s", group, system, err)
+            self._drop_group(data, group)
+            raise
+
+    @staticmethod
+    def _drop_group(data: dict, group: str) -> None:
+        """Forget the values of a group that could not be read, so they do not show frozen.
+
+        The inventory group is not in FETCH_GROUPS: static, it is kept.
+        """
+        for key in FETCH_GROUPS.get(group, ()):
+            data.pop(key, None)
+
+    def _async_update_device(self, system: str, EmbSysInfo: dict) -> None:
+        """Push a changed model or BIOS version to the device registry."""
+        device_registry = dr.async_get(self.hass)
+        device = device_registry.async_get_device(
+            identifiers={(DOMAIN, f"{self.config_entry.data['info']['ServiceTag']}_{system}")}
+        )
+        if device is None:
+            return
+
+        if (device.sw_version, device.model) != (EmbSysInfo["sw_version"], EmbSysInfo["model"]):
+            device_registry.async_update_device(
+                device.id, sw_version=EmbSysInfo["sw_version"], model=EmbSysInfo["model"]
+            )
@@ -0,0 +1,46 @@
+"""Diagnostics support for HA_idrac7_redfish."""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_PASSWORD, CONF_USERNAME, CONF_WEBHOOK_ID
+from homeassistant.core import HomeAssistant
+
+from .api_manager import ApiRequestManager
+from .const import DOMAIN
+from .coordinator import IdracCoordinator
+from .RedfishApi import RedfishApihub
+
+TO_REDACT = {CONF_PASSWORD, CONF_USERNAME, CONF_WEBHOOK_ID}
+
+
+async def async_get_config_entry_diagnostics(hass: HomeAssistant, config_entry: ConfigEntry) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    api: RedfishApihub = hass.data[DOMAIN][config_entry.entry_id]["api"]
+    api_manager: ApiRequestManager = hass.data[DOMAIN][config_entry.entry_id]["api_manager"]
+    coordinator: IdracCoordinator = hass.data[DOMAIN][config_entry.entry_id]["coordinator"]
+
+    listener = hass.data[DOMAIN][config_entry.entry_id].get("event_listener")
+    subscription = hass.data[DOMAIN][config_entry.entry_id].get("event_subscription")
+
+    return {
+        "entry": async_redact_data(config_entry.data, TO_REDACT),
+        "requests": dict(api.stats),
+        "capabilities": dict(api.capabilities),
+        "resource_cache": {**api.cache.stats, **api.cache.usage()},
+        "conditional_gets": {
+            path: {**counts, "hit_ratio": round(counts["hits"] / max(counts["hits"] + counts["misses"], 1), 3)}
+            for path, counts in api.etagStats.items()
+        },
+        "request_manager": dict(api_manager.stats),
+        "event_stream": dict(listener.stats) if listener is not None else None,
+        "event_subscription": dict(subscription.stats) if subscription is not None else None,
+        "polling": {
+            "adaptive": coordinator.adaptive_threshold is not None,
+            "configured_intervals": dict(coordinator.base_intervals),
+            "effective_intervals": dict(coordinator.intervals),
+            "event_push": coordinator.push_active,
+        },
+    }
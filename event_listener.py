@@ -0,0 +1,325 @@
+"""EventService push listeners (SSE stream and webhook subscription) for iDRAC Redfish integration."""
+
+import asyncio
+import json
+import logging
+import time
+from datetime import datetime, timedelta
+
+import aiohttp
+from aiohttp import web
+from redfish.rest.v1 import InvalidCredentialsError, RetriesExhaustedError, SessionCreationError
+
+from homeassistant.components import webhook
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant
+from homeassistant.helpers.event import async_track_time_interval
+
+from .const import DOMAIN, EVENT_REDFISH, SSE_READ_TIMEOUT, SSE_RECONNECT_MAX, SSE_RECONNECT_MIN, SSE_STABLE_SECONDS, WEBHOOK_SILENCE_TIMEOUT
+from .coordinator import IdracCoordinator
+from .RedfishApi import RedfishApihub
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class SseParser:
+    """Incremental text/event-stream parser, fed one decoded line at a time."""
+
+    def __init__(self) -> None:
+        self._data: list[str] = []
+
+    def feed(self, line: str) -> str | None:
+        """Consume a line, return the data of the event it completes (if any)."""
+        line = line.rstrip("\r\n")
+
+        if not line:
+            # blank line: dispatch the pending event
+            if not self._data:
+                return None
+            data = "\n".join(self._data)
+            self._data = []
+            return data
+
+        if line.startswith(":"):
+            # comment, used by servers as keep-alive
+            return None
+
+        field, _, value = line.partition(":")
+        if field == "data":
+            self._data.append(value[1:] if value.startswith(" ") else value)
+
+        # id, event and retry fields carry nothing the coordinator needs
+        return None
+
+
+def event_records(payload: dict) -> list[dict]:
+    """Event records of a Redfish Event payload (metric reports and others yield none)."""
+    if "Events" in payload:
+        return [record for record in payload["Events"] if isinstance(record, dict)]
+
+    if "MessageId" in payload:
+        # some firmware streams bare event records
+        return [payload]
+
+    return []
+
+
+def event_system(record: dict) -> str | None:
+    """Embedded system ID an event record refers to, None when it is not system specific."""
+    origin = (record.get("OriginOfCondition") or {})
+    uri = origin.get("@odata.id", "") if isinstance(origin, dict) else str(origin)
+
+    parts = uri.rstrip("/").split("/")
+    if "Systems" in parts and parts.index("Systems") + 1 < len(parts):
+        return parts[parts.index("Systems") + 1]
+
+    return None
+
+
+async def async_apply_events(hass: HomeAssistant, coordinator: IdracCoordinator, payload: dict) -> int:
+    """Fire every event record of a payload on the bus and refresh the systems it touches.
+
+    Returns the number of event records applied.
+    """
+    records = event_records(payload)
+    if not records:
+        return 0
+
+    systems: set[str] = set()
+    for record in records:
+        system = event_system(record)
+
+        hass.bus.async_fire(
+            EVENT_REDFISH,
+            {
+                "service_tag": coordinator.config_entry.data["info"]["ServiceTag"],
+                "system": system,
+                "event_type": record.get("EventType"),
+                "message_id": record.get("MessageId"),
+                "message": record.get("Message"),
+                "severity": record.get("MessageSeverity", record.get("Severity")),
+            },
+        )
+
+        if system is None:
+            # not tied to a system (manager, chassis...): it may still change health
+            systems.update(coordinator.systems)
+        elif system in coordinator.systems:
+            systems.add(system)
+
+    if systems:
+        await coordinator.async_push_update(sorted(systems))
+
+    return len(records)
+
+
+class RedfishSseListener:
+    """Stream EventService events of one iDRAC into its coordinator.
+
+    Every event record refreshes power state and health of the systems it refers to
+    and is fired on the HA bus as EVENT_REDFISH. While the stream is connected the
+    coordinator polls the fast tier only as reconciliation.
+    """
+
+    def __init__(self, hass: HomeAssistant, api: RedfishApihub, coordinator: IdracCoordinator, uri: str) -> None:
+        """Initialize the listener."""
+        self.hass = hass
+        self.api = api
+        self.coordinator = coordinator
+        self.uri = uri
+        self._task: asyncio.Task | None = None
+        self._delivered = False
+
+        # counters, exposed through diagnostics
+        self.stats: dict[str, int] = {
+            "connects": 0,
+            "events": 0,
+        }
+
+    def async_start(self) -> None:
+        """Start streaming in the background."""
+        if self._task is None:
+            self._task = self.hass.async_create_background_task(
+                self._run(), f"{self.coordinator.name} event stream"
+            )
+
+    async def async_stop(self) -> None:
+        """Stop streaming and restore regular polling."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+        self.coordinator.set_push_active(False)
+
+    async def _run(self) -> None:
+        """Keep a stream open, reconnecting with exponential backoff.
+
+        The backoff is reset only by a stream that delivered data or stayed up for
+        SSE_STABLE_SECONDS, so firmware closing every stream at once (or answering
+        with an empty body) is not hammered in a tight loop.
+        """
+        backoff = SSE_RECONNECT_MIN
+        while True:
+            self._delivered = False
+            started = time.monotonic()
+            try:
+                await self._stream()
+                _LOGGER.debug("Event stream of %s closed by the server", self.api.ip)
+
+            except InvalidCredentialsError as err:
+                _LOGGER.warning("Event stream of %s rejected the credentials: %s", self.api.ip, err)
+
+            except (aiohttp.ClientError, asyncio.TimeoutError, RetriesExhaustedError, SessionCreationError) as err:
+                _LOGGER.debug("Event stream of %s lost: %s", self.api.ip, err)
+
+            except Exception:
+                # keep the listener alive, polling covers the gap
+                _LOGGER.exception("Unexpected error in the event stream of %s", self.api.ip)
+
+            finally:
+                self.coordinator.set_push_active(False)
+
+            if self._delivered or time.monotonic() - started >= SSE_STABLE_SECONDS:
+                backoff = SSE_RECONNECT_MIN
+
+            await asyncio.sleep(backoff)
+            backoff = min(backoff * 2, SSE_RECONNECT_MAX)
+
+    async def _stream(self) -> None:
+        """Read one connection until it ends."""
+        resp = await self.api.openEventStream(self.uri, SSE_READ_TIMEOUT)
+        try:
+            self.stats["connects"] += 1
+            self.coordinator.set_push_active(True)
+            _LOGGER.debug("Event stream of %s connected", self.api.ip)
+
+            # events delivered while disconnected are lost, catch up once
+            await self.coordinator.async_push_update()
+
+            parser = SseParser()
+            async for raw in resp.content:
+                data = parser.feed(raw.decode("utf-8", errors="replace"))
+                if data is not None:
+                    # keep-alive comments alone do not prove a working stream
+                    self._delivered = True
+                    await self._handle(data)
+        finally:
+            resp.release()
+
+    async def _handle(self, data: str) -> None:
+        """Apply one SSE event to the coordinator."""
+        try:
+            payload = json.loads(data)
+        except ValueError:
+            _LOGGER.debug("Ignoring non JSON event from %s: %s", self.api.ip, data[:200])
+            return
+
+        if isinstance(payload, dict):
+            self.stats["events"] += await async_apply_events(self.hass, self.coordinator, payload)
+
+
+class RedfishWebhookSubscription:
+    """Receive EventService push deliveries on an HA webhook (iDRACs without SSE).
+
+    The Redfish subscription is tagged with a per-entry Context, so one left behind
+    by a crash is replaced on the next start instead of piling up on the iDRAC.
+    Polling slows down only once a delivery has actually arrived: the iDRAC may
+    never reach the (local, often plain HTTP) webhook URL. After WEBHOOK_SILENCE_TIMEOUT
+    without a delivery polling resumes, and the subscription is re-created if the
+    iDRAC dropped it (reset, purge) or it points at an outdated HA URL.
+    """
+
+    def __init__(self, hass: HomeAssistant, api: RedfishApihub, coordinator: IdracCoordinator, webhook_id: str) -> None:
+        """Initialize the subscription."""
+        self.hass = hass
+        self.api = api
+        self.coordinator = coordinator
+        self.webhook_id = webhook_id
+        self.context = f"{DOMAIN}:{coordinator.config_entry.entry_id}"
+        self.location: str | None = None
+        self.last_delivery: float | None = None
+        self._unsub_watchdog: CALLBACK_TYPE | None = None
+
+        # counters, exposed through diagnostics
+        self.stats: dict[str, int] = {
+            "deliveries": 0,
+            "events": 0,
+            "resubscribed": 0,
+        }
+
+    async def async_subscribe(self) -> None:
+        """Register the webhook and the Redfish subscription pointing at it."""
+        webhook.async_register(
+            self.hass,
+            DOMAIN,
+            f"iDRAC {self.coordinator.config_entry.data['info']['ServiceTag']} events",
+            self.webhook_id,
+            self._handle_webhook,
+            local_only=True,
+        )
+
+        try:
+            await self._create()
+        except BaseException:
+            # also on cancellation (request timeout), the webhook must not stay registered
+            webhook.async_unregister(self.hass, self.webhook_id)
+            raise
+
+        self._unsub_watchdog = async_track_time_interval(
+            self.hass, self._async_watchdog, timedelta(seconds=WEBHOOK_SILENCE_TIMEOUT)
+        )
+
+    def _destination(self) -> str:
+        # the webhook is local_only: hand the iDRAC the internal URL
+        return webhook.async_generate_url(self.hass, self.webhook_id, allow_external=False, prefer_external=False)
+
+    async def _create(self) -> None:
+        await self.api.deleteEventSubscriptions(self.context)
+        self.location = await self.api.createEventSubscription(self._destination(), self.context)
+
+    async def _async_watchdog(self, now: datetime) -> None:
+        """Fall back to polling when deliveries stopped, and repair the subscription."""
+        if self.last_delivery is not None and time.monotonic() - self.last_delivery < WEBHOOK_SILENCE_TIMEOUT:
+            return
+
+        # a quiet server sends nothing either: polling is right until the next delivery
+        self.coordinator.set_push_active(False)
+
+        try:
+            subscription = await self.api.getEventSubscription(self.location) if self.location else None
+            if subscription is None or subscription.get("Destination") != self._destination():
+                _LOGGER.info("iDRAC %s event subscription missing or outdated, re-creating it", self.api.ip)
+                await self._create()
+                self.stats["resubscribed"] += 1
+        except Exception as err:
+            _LOGGER.debug("iDRAC %s event subscription check failed: %s", self.api.ip, err)
+
+    async def async_unsubscribe(self) -> None:
+        """Remove the Redfish subscription and the webhook."""
+        if self._unsub_watchdog is not None:
+            self._unsub_watchdog()
+            self._unsub_watchdog = None
+
+        webhook.async_unregister(self.hass, self.webhook_id)
+        self.coordinator.set_push_active(False)
+
+        if self.location is not None:
+            await self.api.deleteEventSubscription(self.location)
+            self.location = None
+
+    async def _handle_webhook(self, hass: HomeAssistant, webhook_id: str, request: web.Request) -> None:
+        """Apply one push delivery."""
+        try:
+            payload = await request.json()
+        except ValueError:
+            _LOGGER.debug("Ignoring non JSON event delivery for %s", self.api.ip)
+            return
+
+        self.stats["deliveries"] += 1
+        self.last_delivery = time.monotonic()
+        self.coordinator.set_push_active(True)
+        if isinstance(payload, dict):
+            self.stats["events"] += await async_apply_events(hass, self.coordinator, payload)
@@ -0,0 +1,87 @@
+"""Bounded LRU + TTL cache of parsed Redfish resources for iDRAC Redfish integration."""
+
+import json
+import time
+from collections import OrderedDict
+from typing import Any
+
+
+class ResourceCache:
+    """LRU cache whose entries expire after the TTL of their resource class.
+
+    Entries are keyed by (resourceClass, key). The least recently used entry is
+    evicted once maxEntries is reached; the approximate size of every entry (its
+    JSON length) is tracked so diagnostics can report the memory held.
+    """
+
+    MISSING = object()
+
+    def __init__(self, maxEntries: int, ttls: dict[str, float]) -> None:
+        """Initialize the cache."""
+        self.maxEntries = maxEntries
+        self.ttls = ttls
+
+        # (resourceClass, key) -> (monotonic time stored, value, approximate bytes)
+        self._entries: OrderedDict[tuple[str, str], tuple[float, Any, int]] = OrderedDict()
+
+        # counters, exposed through diagnostics
+        self.stats: dict[str, int] = {
+            "hits": 0,
+            "misses": 0,
+            "expired": 0,
+            "evictions": 0,
+            "invalidations": 0,
+        }
+
+    def get(self, resourceClass: str, key: str, maxAge: float | None = None) -> Any:
+        """Return a fresh cached value or ResourceCache.MISSING.
+
+        maxAge overrides the TTL of the resource class for this lookup.
+        """
+        entry = self._entries.get((resourceClass, key))
+        if entry is None:
+            self.stats["misses"] += 1
+            return self.MISSING
+
+        ttl = self.ttls.get(resourceClass, 0) if maxAge is None else maxAge
+        if time.monotonic() - entry[0] >= ttl:
+            self.stats["expired"] += 1
+            self.stats["misses"] += 1
+            return self.MISSING
+
+        self._entries.move_to_end((resourceClass, key))
+        self.stats["hits"] += 1
+        return entry[1]
+
+    def set(self, resourceClass: str, key: str, value: Any) -> None:
+        """Store a value, evicting the least recently used entries beyond maxEntries."""
+        try:
+            size = len(json.dumps(value, default=str))
+        except (TypeError, ValueError):
+            size = 0
+
+        self._entries[(resourceClass, key)] = (time.monotonic(), value, size)
+        self._entries.move_to_end((resourceClass, key))
+
+        while len(self._entries) > self.maxEntries:
+            self._entries.popitem(last=False)
+            self.stats["evictions"] += 1
+
+    def invalidate(self, resourceClass: str | None = None, key: str | None = None) -> None:
+        """Drop one entry, a whole resource class, or everything."""
+        stale = [
+            entry
+            for entry in self._entries
+            if (resourceClass is None or entry[0] == resourceClass) and (key is None or entry[1] == key)
+        ]
+        for entry in stale:
+            del self._entries[entry]
+
+        self.stats["invalidations"] += len(stale)
+
+    def usage(self) -> dict[str, int]:
+        """Entry count and approximate bytes held."""
+        return {
+            "entries": len(self._entries),
+            "bytes": sum(entry[2] for entry in self._entries.values()),
+        }
@@ -13,9 +13,11 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 
 # local import
+from .api_manager import ApiRequestManager
+from .coordinator import IdracCoordinator
 from .const import DELAY_TIME, DOMAIN, FANS, PSU, TEMPERATURE, WATTSENSOR, TotalWattConsumption
 from .RedfishApi import RedfishApihub
-from .type_sensor.sensor.SensorCoordinator import SensorCoordinator
+from .type_sensor.sensor.SensorKey import SensorKey
 from .type_sensor.sensor.Server_Fan_sensor import FanSensor
 from .type_sensor.sensor.Server_Power_sensor import ElectricitySensor
 from .type_sensor.sensor.Server_PSU_sensor import PSUSensor
@@ -30,7 +32,9 @@ _LOGGER = logging.getLogger(__name__)
 
 async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry, async_add_entities: AddEntitiesCallback) -> None:
     """Set up sensors from a config entry."""
-    api: RedfishApihub = hass.data[DOMAIN][config_entry.entry_id]
+    api: RedfishApihub = hass.data[DOMAIN][config_entry.entry_id]["api"]
+    api_manager: ApiRequestManager = hass.data[DOMAIN][config_entry.entry_id]["api_manager"]
+    coordinator: IdracCoordinator = hass.data[DOMAIN][config_entry.entry_id]["coordinator"]
 
     # Get embedded systems and their status from config_entry data
     config_data = config_entry.data
@@ -46,23 +50,31 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry, asyn
         "PullingTime": pulling_time
     }
 
-    # Set up sensors for each enabled embedded system
-    for emb_sys in embedded_systems:
-        # Skip disabled embedded systems
-        if not emb_sys.get("enable", True):
-            _LOGGER.debug("Skipping disabled system: %s", emb_sys["id"])
-            continue
-
+    async def async_add_system(emb_sys: dict) -> None:
+        """Set up sensors for this embedded system, also used when it gets enabled later."""
         info_single_system["id"] = emb_sys["id"]
         _LOGGER.debug("Setting up sensors for system: %s", emb_sys["id"])
 
         await setup_Embedded_System_entry(
             hass=hass,
             api=api,
-            async_add_entities=async_add_entities,
-            infoSingleSystem=info_single_system.copy()
+            api_manager=api_manager,
+            coordinator=coordinator,
+            async_add_entities=coordinator.track_entities(emb_sys["id"], async_add_entities),
+            infoSingleSystem=info_single_system.copy(),
+            member=emb_sys,
         )
-        # Set up sensors for this embedded system
+
+    coordinator.system_adders.append(async_add_system)
+
+    # Set up sensors for each enabled embedded system
+    for emb_sys in embedded_systems:
+        # Skip disabled embedded systems
+        if not emb_sys.get("enable", True):
+            _LOGGER.debug("Skipping disabled system: %s", emb_sys["id"])
+            continue
+
+        await async_add_system(emb_sys)
 
 
 
@@ -81,9 +93,10 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry, asyn
     return None
 
 
-async def setup_Embedded_System_entry(hass: HomeAssistant, api : RedfishApihub, async_add_entities: AddEntitiesCallback, infoSingleSystem : dict):
+async def setup_Embedded_System_entry(hass: HomeAssistant, api : RedfishApihub, api_manager : ApiRequestManager, coordinator : IdracCoordinator, async_add_entities: AddEntitiesCallback, infoSingleSystem : dict, member : dict):
     """Set up sensors for an embedded system."""
-    EmbSysInfo = await hass.async_add_executor_job(api.getEmbSysInfo, infoSingleSystem['id'])
+    # discovered inventory stored in the entry, the coordinator's slow tier keeps the device registry current
+    EmbSysInfo = member["DeviceInfo"]
     _LOGGER.debug("Setting up device: %s_%s", infoSingleSystem['ServiceTag'], infoSingleSystem['id'])
 
     device_info = DeviceInfo(
@@ -95,9 +108,7 @@ async def setup_Embedded_System_entry(hass: HomeAssistant, api : RedfishApihub,
         serial_number=infoSingleSystem['ServiceTag']
     )
 
-    coordinator = SensorCoordinator(hass, api, infoSingleSystem['id'], infoSingleSystem['PullingTime'])
-
-    EmbSysCooledBy = await hass.async_add_executor_job(api.getEmbeddedSystemCooledBy, infoSingleSystem['id'])
+    EmbSysCooledBy = member["DeviceSensor"]["fans"]
     _LOGGER.info("Cooling components: "+ str(EmbSysCooledBy))
 
     toAddSensor = []
@@ -105,31 +116,30 @@ async def setup_Embedded_System_entry(hass: HomeAssistant, api : RedfishApihub,
     #add fans sensor
     for elm in EmbSysCooledBy:
         _LOGGER.info("add sensorFan for status: "+elm)
-        toAddSensor.append( FanSensor(coordinator,  str({"type": FANS, "id": elm}), device_info, infoSingleSystem) )
+        toAddSensor.append( FanSensor(coordinator,  SensorKey(FANS, elm, infoSingleSystem['id']), device_info, infoSingleSystem) )
 
 
     #add Power sensor sensor
     _LOGGER.info("add Power Sensor for status: "+infoSingleSystem['id'])
-    toAddSensor.append( ElectricitySensor(coordinator, str({"type": WATTSENSOR, "id": TotalWattConsumption}), device_info, infoSingleSystem) )
+    toAddSensor.append( ElectricitySensor(coordinator, SensorKey(WATTSENSOR, TotalWattConsumption, infoSingleSystem['id']), device_info, infoSingleSystem) )
+
 
+    #add temp sensor, names stored at discovery so they exist even if the host is off
+    tempNames = member["DeviceSensor"]["TemperatureSensor"]
 
-    #add temp sensor
-    tempSensor = await hass.async_add_executor_job(api.getTemperatureSensor, infoSingleSystem['id'])
-    for elm in tempSensor:
-        _LOGGER.info("add sensorTemp for status: "+elm.get("Name"))
-        toAddSensor.append( TemperatureSensor(coordinator, str({"type": TEMPERATURE, "id": elm.get("Name")}), device_info, infoSingleSystem) )
+    for name in tempNames:
+        _LOGGER.info("add sensorTemp for status: "+name)
+        toAddSensor.append( TemperatureSensor(coordinator, SensorKey(TEMPERATURE, name, infoSingleSystem['id']), device_info, infoSingleSystem) )
 
     #add PSU voltage sensor
-    EmbSysPoweredBy = await hass.async_add_executor_job(api.getEmbeddedSystemPoweredBy, infoSingleSystem['id'])
+    EmbSysPoweredBy = member["DeviceSensor"]["PSU"]
     _LOGGER.info("Power supply units: "+ str(EmbSysPoweredBy))
     for psuID in EmbSysPoweredBy:
         _LOGGER.info("add PSU voltage sensor for: "+psuID)
-        toAddSensor.append( PSUSensor(coordinator, str({"type": PSU, "id": psuID}), device_info, infoSingleSystem) )
+        toAddSensor.append( PSUSensor(coordinator, SensorKey(PSU, psuID, infoSingleSystem['id']), device_info, infoSingleSystem) )
 
-    #add sensor
-    async_add_entities(toAddSensor,True)
-    #schedule first update
-    await coordinator.async_config_entry_first_refresh()
+    #add sensor, the shared coordinator already holds their first values
+    async_add_entities(toAddSensor)
 
     return True
 
@@ -0,0 +1,127 @@
+"""Redfish session lease of a config entry for iDRAC Redfish integration."""
+
+import logging
+
+from redfish.rest.v1 import SessionCreationError
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_HOST, CONF_PASSWORD, CONF_USERNAME
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.storage import Store
+
+from .api_manager import ApiRequestManager
+from .const import DOMAIN, PRIORITY_CRITICAL, PRIORITY_LOW, REQUEST_TIMEOUT_DEFAULT, SESSION_STORAGE_VERSION
+from .RedfishApi import RedfishApihub
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def _session_store(hass: HomeAssistant, config_entry: ConfigEntry) -> Store:
+    # private: the file holds a live X-Auth-Token, it is written readable by HA only
+    return Store(hass, SESSION_STORAGE_VERSION, f"{DOMAIN}.session.{config_entry.entry_id}", private=True)
+
+
+async def async_remove_entry_session(hass: HomeAssistant, config_entry: ConfigEntry) -> None:
+    """Log out the stored session of a removed entry and drop its storage."""
+    store = _session_store(hass, config_entry)
+    session = ((await store.async_load()) or {}).get("session")
+
+    if session:
+        authdata = config_entry.data["authdata"]
+        api = RedfishApihub(
+            authdata[CONF_HOST], authdata[CONF_USERNAME], authdata[CONF_PASSWORD], async_get_clientsession(hass, verify_ssl=False)
+        )
+        api.auth_token = session["token"]
+        api.session_location = session["location"]
+        await api.logout()
+
+    await store.async_remove()
+
+
+class SessionLease:
+    """The Redfish session of one config entry, kept across reloads and HA restarts.
+
+    Token and URI of the session are stored in HA storage and the next setup resumes
+    the session instead of logging in again (the slowest call on an iDRAC7). Every
+    session the entry opened is recorded with its host until the iDRAC no longer has
+    it: one that cannot be resumed is deleted by the next acquire.
+    """
+
+    def __init__(self, hass: HomeAssistant, config_entry: ConfigEntry, api: RedfishApihub, api_manager: ApiRequestManager) -> None:
+        """Initialize the lease."""
+        self.hass = hass
+        self.api = api
+        self.api_manager = api_manager
+        self._store = _session_store(hass, config_entry)
+        # {"host", "location"} of every session opened and not known to be gone
+        self._locations: list[dict[str, str]] = []
+
+    async def async_acquire(self) -> None:
+        """Resume, adopt or open the session, reaping the stale ones of this integration."""
+        stored = await self._store.async_load() or {}
+        session = stored.get("session")
+
+        if self.api.auth_token is None and session and (session["host"], session["user"]) == (self.api.ip, self.api.user):
+            await self.api_manager.request(
+                self.api.resumeSession, session["token"], session["location"], priority=PRIORITY_CRITICAL, timeout=REQUEST_TIMEOUT_DEFAULT
+            )
+
+        # the host may have changed since: sessions of the old one are not ours to delete here
+        self._locations = list(stored.get("locations", []))
+        known = [
+            entry["location"] for entry in self._locations
+            if entry["host"] == self.api.ip and entry["location"] != self.api.session_location
+        ]
+
+        swept = False
+        try:
+            await self.api_manager.request(self.api.singleton_login, priority=PRIORITY_CRITICAL, timeout=REQUEST_TIMEOUT_DEFAULT, retries=1)
+        except SessionCreationError:
+            # most likely the session table is full: sweep without a session, then retry once
+            _LOGGER.warning("iDRAC %s refused a new session, removing stale sessions", self.api.ip)
+            gone = await self.api_manager.request(self.api.sweepSessions, known, True, priority=PRIORITY_CRITICAL, timeout=REQUEST_TIMEOUT_DEFAULT)
+            self._forget(gone)
+            await self.api_manager.request(self.api.singleton_login, priority=PRIORITY_CRITICAL, timeout=REQUEST_TIMEOUT_DEFAULT, retries=1)
+            swept = True
+
+        # recorded before anything else can fail, so a failed setup keeps it for the next try;
+        # a re-login during the lease opens a new session, record it as well
+        self.api.onSessionCreated = self._async_record
+        await self._async_record()
+
+        if not swept:
+            try:
+                gone = await self.api_manager.request(self.api.sweepSessions, known, priority=PRIORITY_LOW, timeout=REQUEST_TIMEOUT_DEFAULT)
+            except Exception as err:
+                _LOGGER.debug("iDRAC %s: stale session sweep skipped: %s", self.api.ip, err)
+            else:
+                self._forget(gone)
+                await self._async_record()
+
+    async def async_suspend(self) -> None:
+        """Leave the session open and stored for the next setup (reload, HA restart, failed setup)."""
+        self.api.onSessionCreated = None
+
+    async def async_release(self) -> None:
+        """Log the session out and forget it (entry disabled)."""
+        self.api.onSessionCreated = None
+        await self.api_manager.request(self.api.logout, priority=PRIORITY_CRITICAL, timeout=REQUEST_TIMEOUT_DEFAULT)
+        # the location stays: if the DELETE failed the next acquire sweeps it
+        await self._store.async_save({"locations": self._locations, "session": None})
+
+    def _forget(self, gone: list[str]) -> None:
+        self._locations = [
+            entry for entry in self._locations if entry["host"] != self.api.ip or entry["location"] not in gone
+        ]
+
+    async def _async_record(self) -> None:
+        location = self.api.session_location
+        session = None
+        if self.api.auth_token and location:
+            session = {"host": self.api.ip, "user": self.api.user, "token": self.api.auth_token, "location": location}
+            entry = {"host": self.api.ip, "location": location}
+            if entry not in self._locations:
+                self._locations.append(entry)
+
+        await self._store.async_save({"locations": self._locations, "session": session})
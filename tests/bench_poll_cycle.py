@@ -0,0 +1,149 @@
+"""Poll cycle benchmark: async RedfishApihub against the former executor-thread path.
+
+Run from the repository root (needs aiohttp and the redfish library):
+
+    python tests/bench_poll_cycle.py --idracs 20 --latency 0.05 --cycles 5
+
+Every cycle reads, for each simulated iDRAC, what one coordinator tick reads: the
+Systems, Thermal and Power resources. The executor path is how the integration
+polled before the async client: one blocking redfish library call per resource,
+each run on a thread of a pool sized like HA's shared executor. Reported per cycle:
+wall time, thread-seconds held on the executor and the peak of busy threads, for the
+async hub whatever it still hands to loop.run_in_executor.
+"""
+
+import argparse
+import asyncio
+import statistics
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import aiohttp
+import redfish
+
+from redfish_standin import RedfishStandIn
+
+RESOURCES = (
+    "/redfish/v1/Systems/System.Embedded.1",
+    "/redfish/v1/Chassis/System.Embedded.1/Thermal",
+    "/redfish/v1/Chassis/System.Embedded.1/Power",
+)
+
+
+class ThreadMeter:
+    """Thread-seconds and peak concurrency of the jobs sent to an executor."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.busy = 0
+        self.peak = 0
+        self.thread_seconds = 0.0
+
+    def run(self, func, *args):
+        with self._lock:
+            self.busy += 1
+            self.peak = max(self.peak, self.busy)
+        started = time.perf_counter()
+        try:
+            return func(*args)
+        finally:
+            with self._lock:
+                self.busy -= 1
+                self.thread_seconds += time.perf_counter() - started
+
+
+async def bench_executor(idracs: list[RedfishStandIn], cycles: int, workers: int) -> list[tuple[float, float, int]]:
+    loop = asyncio.get_running_loop()
+    executor = ThreadPoolExecutor(max_workers=workers)
+
+    clients = []
+    for idrac in idracs:
+        client = await loop.run_in_executor(executor, lambda url=idrac.url: redfish.redfish_client(base_url=url, username="root", password="calvin", timeout=10))
+        await loop.run_in_executor(executor, lambda client=client: client.login(auth="session"))
+        clients.append(client)
+
+    results = []
+    for _ in range(cycles):
+        meter = ThreadMeter()
+        started = time.perf_counter()
+        await asyncio.gather(*(
+            loop.run_in_executor(executor, meter.run, client.get, path)
+            for client in clients
+            for path in RESOURCES
+        ))
+        results.append((time.perf_counter() - started, meter.thread_seconds, meter.peak))
+
+    for client in clients:
+        await loop.run_in_executor(executor, client.logout)
+    executor.shutdown()
+    return results
+
+
+async def bench_async(idracs: list[RedfishStandIn], cycles: int) -> list[tuple[float, float, int]]:
+    async with aiohttp.ClientSession() as session:
+        hubs = [idrac.hub(session) for idrac in idracs]
+        for api in hubs:
+            await api.singleton_login()
+
+        async def tick(api) -> None:
+            await asyncio.gather(
+                api.getSystemSnapshot("System.Embedded.1", maxAge=0),
+                api.getThermalSensors("System.Embedded.1"),
+                api.getPowerSensors("System.Embedded.1"),
+            )
+
+        # count whatever still reaches the executor (DNS lookups, blocking helpers)
+        loop = asyncio.get_running_loop()
+        run_in_executor = loop.run_in_executor
+        meter = ThreadMeter()
+        # reads the meter of the running cycle
+        loop.run_in_executor = lambda executor, func, *args: run_in_executor(executor, meter.run, func, *args)
+
+        results = []
+        try:
+            for _ in range(cycles):
+                meter = ThreadMeter()
+                started = time.perf_counter()
+                await asyncio.gather(*(tick(api) for api in hubs))
+                results.append((time.perf_counter() - started, meter.thread_seconds, meter.peak))
+        finally:
+            del loop.run_in_executor
+
+        for api in hubs:
+            await api.logout()
+        return results
+
+
+async def main(args: argparse.Namespace) -> None:
+    idracs = [RedfishStandIn(latency=args.latency) for _ in range(args.idracs)]
+    for idrac in idracs:
+        await idrac.__aenter__()
+
+    try:
+        rows = {
+            f"executor ({args.workers} threads)": await bench_executor(idracs, args.cycles, args.workers),
+            "async hub": await bench_async(idracs, args.cycles),
+        }
+    finally:
+        for idrac in idracs:
+            await idrac.__aexit__(None, None, None)
+
+    print(f"{args.idracs} iDRACs x {len(RESOURCES)} resources, {args.latency * 1000:.0f} ms per request, {args.cycles} cycles")
+    print(f"{'path':<24}{'wall ms/cycle':>16}{'thread-s/cycle':>16}{'peak threads':>14}")
+    for name, results in rows.items():
+        print(
+            f"{name:<24}"
+            f"{statistics.mean(row[0] for row in results) * 1000:>16.1f}"
+            f"{statistics.mean(row[1] for row in results):>16.2f}"
+            f"{max(row[2] for row in results):>14}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--idracs", type=int, default=20)
+    parser.add_argument("--latency", type=float, default=0.05, help="seconds the stand-in takes per request")
+    parser.add_argument("--cycles", type=int, default=5)
+    parser.add_argument("--workers", type=int, default=8, help="executor threads left for this integration")
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,6 @@
+"""Test configuration: the stand-in needs aiohttp, the hub the redfish library."""
+
+import pytest
+
+pytest.importorskip("aiohttp")
+pytest.importorskip("redfish")
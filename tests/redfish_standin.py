@@ -0,0 +1,196 @@
+"""Local Redfish stand-in server for the tests and the poll cycle benchmark.
+
+Serves just enough of an iDRAC (service root, sessions, Systems, Thermal, Power and an
+SSE stream) over plain HTTP, with an optional per-request latency, and counts what it
+was asked for.
+"""
+
+import asyncio
+import importlib
+import itertools
+import json
+import sys
+import types
+from pathlib import Path
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+ROOT = Path(__file__).resolve().parent.parent
+PACKAGE = "HA_idrac7_redfish"
+
+SESSIONS = "/redfish/v1/SessionService/Sessions"
+SSE_URI = "/redfish/v1/SSE"
+
+
+def load(module: str) -> types.ModuleType:
+    """Import a module of the integration without running its __init__ (platform setup)."""
+    if PACKAGE not in sys.modules:
+        package = types.ModuleType(PACKAGE)
+        package.__path__ = [str(ROOT)]
+        sys.modules[PACKAGE] = package
+
+    return importlib.import_module(f"{PACKAGE}.{module}")
+
+
+class RedfishStandIn:
+    """One fake iDRAC; every session is invalidated at once by rotate()."""
+
+    def __init__(self, latency: float = 0.0, login_latency: float = 0.0, reject_queries: bool = False) -> None:
+        self.latency = latency
+        self.login_latency = login_latency
+        # advertise $select/$expand in the service root, then answer 400 to them
+        self.reject_queries = reject_queries
+        self.rejected = 0
+
+        self.tokens: set[str] = set()
+        self._ids = itertools.count(1)
+        self.logins = 0
+        self.requests = 0
+
+        # SSE: payloads sent to every stream, then the stream is closed (or held open)
+        self.events: list[dict] = []
+        self.hold_stream = False
+        self.stream_connects = 0
+
+        self.server: TestServer | None = None
+
+    async def __aenter__(self) -> "RedfishStandIn":
+        app = web.Application()
+        app.router.add_get("/redfish/v1/", self._root)
+        app.router.add_post(SESSIONS, self._login)
+        app.router.add_get(SESSIONS, self._sessions)
+        app.router.add_route("*", SESSIONS + "/{id}", self._session)
+        app.router.add_get("/redfish/v1/Systems/{id}", self._system)
+        app.router.add_get("/redfish/v1/Chassis/{id}/Thermal", self._thermal)
+        app.router.add_get("/redfish/v1/Chassis/{id}/Power", self._power)
+        app.router.add_get(SSE_URI, self._sse)
+
+        self.server = TestServer(app, host="127.0.0.1")
+        await self.server.start_server()
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.server.close()
+
+    @property
+    def url(self) -> str:
+        return str(self.server.make_url("")).rstrip("/")
+
+    def hub(self, session, **kwargs):
+        """A RedfishApihub pointed at this stand-in."""
+        api = load("RedfishApi").RedfishApihub("127.0.0.1", "root", "calvin", session, **kwargs)
+        api.base_url = self.url
+        return api
+
+    def rotate(self) -> None:
+        """Expire every session, like an iDRAC reboot or idle timeout."""
+        self.tokens.clear()
+
+    # handlers
+
+    async def _authorized(self, request: web.Request) -> bool:
+        self.requests += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        return request.headers.get("X-Auth-Token") in self.tokens
+
+    def _bad_query(self, request: web.Request) -> web.Response | None:
+        if self.reject_queries and ("$select" in request.query or "$expand" in request.query):
+            self.rejected += 1
+            return web.json_response({}, status=400)
+        return None
+
+    async def _root(self, request: web.Request) -> web.Response:
+        self.requests += 1
+        features = {"ExpandQuery": {"NoLinks": True, "Levels": True}, "SelectQuery": True} if self.reject_queries else {}
+        return web.json_response({
+            "RedfishVersion": "1.4.0",
+            "ProtocolFeaturesSupported": features,
+            "Links": {"Sessions": {"@odata.id": SESSIONS}},
+            "SessionService": {"@odata.id": "/redfish/v1/SessionService"},
+            "Systems": {"@odata.id": "/redfish/v1/Systems"},
+            "Oem": {"Dell": {"ServiceTag": "STANDIN"}},
+        })
+
+    async def _login(self, request: web.Request) -> web.Response:
+        self.requests += 1
+        if self.login_latency:
+            # session creation is the slowest call on an iDRAC7
+            await asyncio.sleep(self.login_latency)
+
+        session_id = next(self._ids)
+        token = f"token-{session_id}"
+        self.tokens.add(token)
+        self.logins += 1
+        return web.json_response(
+            {"Id": str(session_id)},
+            status=201,
+            headers={"X-Auth-Token": token, "Location": f"{SESSIONS}/{session_id}"},
+        )
+
+    async def _sessions(self, request: web.Request) -> web.Response:
+        if not await self._authorized(request):
+            return web.json_response({}, status=401)
+        ids = sorted(token.removeprefix("token-") for token in self.tokens)
+        return web.json_response({"Members": [{"@odata.id": f"{SESSIONS}/{session_id}"} for session_id in ids]})
+
+    async def _session(self, request: web.Request) -> web.Response:
+        if not await self._authorized(request):
+            return web.json_response({}, status=401)
+        if request.method == "DELETE":
+            self.tokens.discard(f"token-{request.match_info['id']}")
+            return web.Response(status=204)
+        return web.json_response({"Id": request.match_info["id"], "UserName": "root"})
+
+    async def _system(self, request: web.Request) -> web.Response:
+        if not await self._authorized(request):
+            return web.json_response({}, status=401)
+        if (rejected := self._bad_query(request)) is not None:
+            return rejected
+        return web.json_response({
+            "PowerState": "On",
+            "Status": {"Health": "OK"},
+            "HostName": request.match_info["id"],
+            "Model": "PowerEdge R720",
+            "Manufacturer": "Dell Inc.",
+            "BiosVersion": "2.9.0",
+            "Actions": {"#ComputerSystem.Reset": {"ResetType@Redfish.AllowableValues": ["On", "ForceOff"]}},
+            "Links": {
+                "CooledBy": [{"@odata.id": f"/redfish/v1/Chassis/{request.match_info['id']}/Sensors/Fans/Fan.1"}],
+                "PoweredBy": [{"@odata.id": f"/redfish/v1/Chassis/{request.match_info['id']}/Power/PowerSupplies/PSU.1"}],
+            },
+        })
+
+    async def _thermal(self, request: web.Request) -> web.Response:
+        if not await self._authorized(request):
+            return web.json_response({}, status=401)
+        return web.json_response({
+            "Fans": [{"@odata.id": "Fans/Fan.1", "Reading": 4200}],
+            "Temperatures": [{"@odata.id": "Temps/Inlet", "Name": "System Board Inlet Temp", "ReadingCelsius": 21}],
+        })
+
+    async def _power(self, request: web.Request) -> web.Response:
+        if not await self._authorized(request):
+            return web.json_response({}, status=401)
+        return web.json_response({
+            "PowerSupplies": [{"@odata.id": "PowerSupplies/PSU.1", "LineInputVoltage": 230, "Status": {"Health": "OK"}}],
+            "PowerControl": [{"@odata.id": "PowerControl", "PowerConsumedWatts": 180}],
+        })
+
+    async def _sse(self, request: web.Request) -> web.StreamResponse:
+        if not await self._authorized(request):
+            return web.json_response({}, status=401)
+
+        self.stream_connects += 1
+        resp = web.StreamResponse(headers={"Content-Type": "text/event-stream"})
+        await resp.prepare(request)
+
+        await resp.write(b": keep-alive\n\n")
+        for event in self.events:
+            await resp.write(f"data: {json.dumps(event)}\n\n".encode())
+
+        while self.hold_stream:
+            await asyncio.sleep(0.05)
+
+        return resp
@@ -0,0 +1,35 @@
+"""$select/$expand stay off once the firmware rejected them."""
+
+import asyncio
+
+import aiohttp
+
+from redfish_standin import RedfishStandIn
+
+SYSTEM = "System.Embedded.1"
+
+
+def test_rejected_queries_stay_off() -> None:
+    async def scenario() -> None:
+        async with RedfishStandIn(reject_queries=True) as idrac, aiohttp.ClientSession() as session:
+            api = idrac.hub(session)
+            rejections = []
+            api.onCapabilitiesRejected = lambda: rejections.append(dict(api.capabilities))
+
+            await api.getServiceTag()
+            assert api.capabilities == {"expand": True, "select": True, "rejected": False}
+
+            snapshot = await api.getSystemSnapshot(SYSTEM)
+            assert snapshot["HostName"] == SYSTEM
+            assert idrac.rejected == 1
+            assert rejections == [{"expand": False, "select": False, "rejected": True}]
+
+            # the root advertises them again, a restart restores the stored flag
+            restarted = idrac.hub(session)
+            restarted.capabilities.update(rejections[0])
+            await restarted.getServiceTag()
+            await restarted.getSystemSnapshot(SYSTEM, maxAge=0)
+            assert restarted.capabilities["select"] is False
+            assert idrac.rejected == 1
+
+    asyncio.run(scenario())
@@ -0,0 +1,173 @@
+"""RedfishSseListener against the stand-in's ServerSentEventUri."""
+
+import asyncio
+import inspect
+import time
+import types
+
+import aiohttp
+import pytest
+
+from redfish_standin import SSE_URI, RedfishStandIn, load
+
+pytest.importorskip("homeassistant")
+
+SYSTEM = "System.Embedded.1"
+
+ALERT = {
+    "Events": [
+        {
+            "EventType": "Alert",
+            "MessageId": "PSU0003",
+            "Message": "The power input for power supply 1 is lost.",
+            "MessageSeverity": "Critical",
+            "OriginOfCondition": {"@odata.id": f"/redfish/v1/Systems/{SYSTEM}"},
+        }
+    ]
+}
+
+
+class FakeCoordinator:
+    """The part of IdracCoordinator the listener drives."""
+
+    def __init__(self, fail_push: bool = False) -> None:
+        self.config_entry = types.SimpleNamespace(entry_id="entry", data={"info": {"ServiceTag": "STANDIN"}})
+        self.systems = [SYSTEM]
+        self.name = "iDRAC STANDIN"
+        self.fail_push = fail_push
+        self.push_states: list[bool] = []
+        self.pushed: list[list[str] | None] = []
+
+    def set_push_active(self, active: bool) -> None:
+        self.push_states.append(active)
+
+    async def async_push_update(self, systems: list[str] | None = None) -> None:
+        if self.fail_push:
+            raise RuntimeError("coordinator exploded")
+        self.pushed.append(systems)
+
+
+class FakeBus:
+    def __init__(self) -> None:
+        self.fired: list[tuple[str, dict]] = []
+
+    def async_fire(self, event_type: str, data: dict) -> None:
+        self.fired.append((event_type, data))
+
+
+def _listener(idrac: RedfishStandIn, session: aiohttp.ClientSession, coordinator: FakeCoordinator):
+    event_listener = load("event_listener")
+    hass = types.SimpleNamespace(bus=FakeBus())
+    return event_listener.RedfishSseListener(hass, idrac.hub(session), coordinator, SSE_URI)
+
+
+def test_stream_applies_events() -> None:
+    async def scenario() -> None:
+        async with RedfishStandIn() as idrac, aiohttp.ClientSession() as session:
+            idrac.events = [ALERT]
+            coordinator = FakeCoordinator()
+            listener = _listener(idrac, session, coordinator)
+
+            await listener._stream()
+
+            # catch-up refresh of every system on connect, then the one the alert is about
+            assert coordinator.pushed == [None, [SYSTEM]]
+            assert coordinator.push_states == [True]
+            assert listener.stats == {"connects": 1, "events": 1}
+
+            (event_type, data), = listener.hass.bus.fired
+            assert event_type == load("const").EVENT_REDFISH
+            assert data["system"] == SYSTEM
+            assert data["message_id"] == "PSU0003"
+            assert data["severity"] == "Critical"
+
+    asyncio.run(scenario())
+
+
+@pytest.mark.parametrize("fail_push", [False, True])
+def test_closing_stream_reconnects_with_backoff(monkeypatch: pytest.MonkeyPatch, fail_push: bool) -> None:
+    event_listener = load("event_listener")
+    monkeypatch.setattr(event_listener, "SSE_RECONNECT_MIN", 0.05)
+    monkeypatch.setattr(event_listener, "SSE_RECONNECT_MAX", 0.4)
+
+    async def scenario() -> None:
+        async with RedfishStandIn() as idrac, aiohttp.ClientSession() as session:
+            # 200 with keep-alives only, closed at once (or a failing coordinator)
+            coordinator = FakeCoordinator(fail_push=fail_push)
+            listener = _listener(idrac, session, coordinator)
+
+            task = asyncio.create_task(listener._run())
+            await asyncio.sleep(0.5)
+            assert not task.done(), "the listener task died"
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+            # backoff 0.05, 0.1, 0.2, 0.4: a handful of connects, not a tight loop
+            assert 2 <= idrac.stream_connects <= 5
+            assert coordinator.push_states[-1] is False
+
+    asyncio.run(scenario())
+
+
+class FakeEntry:
+    """The part of a loaded ConfigEntry the coordinator uses."""
+
+    def __init__(self) -> None:
+        from homeassistant.config_entries import ConfigEntryState
+
+        self.entry_id = "entry"
+        self.title = "iDRAC STANDIN"
+        self.data = {"info": {"ServiceTag": "STANDIN"}}
+        self.state = ConfigEntryState.LOADED
+        self.pref_disable_polling = False
+
+    def async_on_unload(self, func) -> None:
+        pass
+
+    def async_create_background_task(self, hass, target, name: str, eager_start: bool = True) -> asyncio.Task:
+        return hass.async_create_background_task(target, name, eager_start)
+
+
+def test_dropped_stream_makes_the_fast_tier_due(tmp_path, monkeypatch: pytest.MonkeyPatch) -> None:
+    from homeassistant.core import HomeAssistant
+    from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+
+    if "config_entry" not in inspect.signature(DataUpdateCoordinator).parameters:
+        pytest.skip("the coordinator needs a Home Assistant release taking config_entry")
+
+    const = load("const")
+    event_listener = load("event_listener")
+    monkeypatch.setattr(event_listener, "SSE_RECONNECT_MIN", 60)
+    base = {const.TIER_FAST: 30, const.TIER_NORMAL: 120, const.TIER_SLOW: 900}
+
+    async def scenario() -> None:
+        hass = HomeAssistant(str(tmp_path))
+        async with RedfishStandIn() as idrac, aiohttp.ClientSession() as session:
+            idrac.hold_stream = True
+            api = idrac.hub(session)
+            coordinator = load("coordinator").IdracCoordinator(
+                hass, FakeEntry(), api, load("api_manager").ApiRequestManager(hass, 2), [SYSTEM], base
+            )
+            listener = event_listener.RedfishSseListener(hass, api, coordinator, SSE_URI)
+
+            task = asyncio.create_task(listener._run())
+            while not coordinator.push_active:
+                await asyncio.sleep(0.01)
+            # a refresh under push: the next power and health read is a reconcile interval away
+            coordinator._next_due[const.TIER_FAST] = time.monotonic() + const.PUSH_RECONCILE_INTERVAL
+
+            idrac.hold_stream = False
+            while coordinator.push_active:
+                await asyncio.sleep(0.01)
+            await hass.async_block_till_done()
+
+            assert coordinator.intervals[const.TIER_FAST] == base[const.TIER_FAST]
+            assert coordinator._next_due[const.TIER_FAST] <= time.monotonic() + base[const.TIER_FAST]
+
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+        await hass.async_stop(force=True)
+
+    asyncio.run(scenario())
@@ -0,0 +1,105 @@
+"""Concurrent reads through one RedfishApihub share a single login and re-login."""
+
+import asyncio
+
+import aiohttp
+
+from redfish_standin import RedfishStandIn, load
+
+PARALLEL_READS = 50
+
+
+def _systems(count: int) -> list[str]:
+    # distinct paths, identical GETs would be coalesced before reaching the session logic
+    return [f"System.Embedded.{index}" for index in range(count)]
+
+
+def test_parallel_first_reads_log_in_once() -> None:
+    async def scenario() -> None:
+        async with RedfishStandIn(login_latency=0.05) as idrac, aiohttp.ClientSession() as session:
+            api = idrac.hub(session)
+
+            snapshots = await asyncio.gather(*(api.getSystemSnapshot(system) for system in _systems(PARALLEL_READS)))
+
+            assert [snapshot["HostName"] for snapshot in snapshots] == _systems(PARALLEL_READS)
+            assert idrac.logins == 1
+            assert api.stats["logins"] == 1
+            assert api.stats["logins_shared"] == PARALLEL_READS - 1
+
+    asyncio.run(scenario())
+
+
+def test_parallel_rejections_relogin_once() -> None:
+    async def scenario() -> None:
+        async with RedfishStandIn(latency=0.01, login_latency=0.05) as idrac, aiohttp.ClientSession() as session:
+            api = idrac.hub(session)
+            await api.singleton_login()
+            first_token = api.auth_token
+
+            # every in flight request now carries a token the iDRAC rejects
+            idrac.rotate()
+            snapshots = await asyncio.gather(*(api.getSystemSnapshot(system) for system in _systems(PARALLEL_READS)))
+
+            assert all(snapshot["PowerState"] == "On" for snapshot in snapshots)
+            assert idrac.logins == 2
+            assert api.stats["relogins"] == 1
+            assert api.stats["logins_shared"] == PARALLEL_READS - 1
+            assert api.auth_token != first_token
+            assert idrac.tokens == {api.auth_token}
+
+    asyncio.run(scenario())
+
+
+def test_logout_waits_for_a_login_in_progress() -> None:
+    async def scenario() -> None:
+        async with RedfishStandIn(login_latency=0.05) as idrac, aiohttp.ClientSession() as session:
+            api = idrac.hub(session)
+
+            login = asyncio.create_task(api.singleton_login())
+            await asyncio.sleep(0)
+            await api.logout()
+            await login
+
+            # the session opened by the login was deleted, not left behind
+            assert idrac.logins == 1
+            assert idrac.tokens == set()
+            assert api.auth_token is None
+
+    asyncio.run(scenario())
+
+
+def test_error_status_is_raised_not_parsed() -> None:
+    RedfishHttpError = load("RedfishApi").RedfishHttpError
+
+    async def scenario() -> None:
+        async with RedfishStandIn() as idrac, aiohttp.ClientSession() as session:
+            api = idrac.hub(session)
+
+            try:
+                await api._get("/redfish/v1/Managers/iDRAC.Embedded.1")
+            except RedfishHttpError as err:
+                assert err.status == 404
+            else:
+                raise AssertionError("a 404 body was returned as a resource")
+
+    asyncio.run(scenario())
+
+
+def test_sweep_reports_the_known_sessions_gone() -> None:
+    SESSIONS = "/redfish/v1/SessionService/Sessions"
+
+    async def scenario() -> None:
+        async with RedfishStandIn() as idrac, aiohttp.ClientSession() as session:
+            leftover = idrac.hub(session)
+            await leftover.singleton_login()
+            api = idrac.hub(session)
+            await api.singleton_login()
+
+            # one session left open by an earlier run, one that expired on its own
+            gone = await api.sweepSessions([leftover.session_location, f"{SESSIONS}/99"])
+
+            assert sorted(gone) == sorted([leftover.session_location, f"{SESSIONS}/99"])
+            assert idrac.tokens == {api.auth_token}
+            assert api.stats["stale_sessions_removed"] == 1
+
+    asyncio.run(scenario())
@@ -1,94 +1,23 @@
 
-import asyncio
-from datetime import timedelta
 import logging
-import sys, os
-import async_timeout
-from homeassistant.components.api import APIErrorLog
 from homeassistant.components.binary_sensor import BinarySensorDeviceClass, BinarySensorEntity, BinarySensorEntityDescription
-from homeassistant.core import HomeAssistant, callback
-from homeassistant.exceptions import ConfigEntryAuthFailed
-
-from redfish.rest.v1 import (
-    InvalidCredentialsError,
-    RetriesExhaustedError,
-    ServerDownOrUnreachableError,
-    SessionCreationError,
-)
+from homeassistant.core import callback
 
 from homeassistant.helpers.device_registry import DeviceInfo
-from homeassistant.helpers.update_coordinator import CoordinatorEntity, DataUpdateCoordinator, UpdateFailed
+from homeassistant.helpers.update_coordinator import CoordinatorEntity, DataUpdateCoordinator
 
 
 #local import
 
-from ...RedfishApi import RedfishApihub
-from ...const import REQUEST_FOR_STATUS_HEALTH
+from ...const import HEALTH
+from ..sensor.SensorKey import SensorKey
 
 _LOGGER = logging.getLogger(__name__)
 
-class HealthStatusCoordinator(DataUpdateCoordinator):
-    """My custom coordinator."""
-
-    def __init__(self, hass: HomeAssistant, my_api : RedfishApihub, PoolingUpdate : int) -> None:
-        """Initialize my coordinator."""
-        super().__init__(
-            hass,
-            _LOGGER,
-            # Name of the data. For logging purposes.
-            name="Health Status",
-            # Polling interval. Will only be polled if there are subscribers.
-            update_interval= timedelta(seconds=int(PoolingUpdate)) #timedelta(seconds=5)
-        )
-
-        self.my_api = my_api
-
-        return None
-
-    async def _async_update_data(self):
-        """Fetch data from API endpoint.
-
-        This is the place to pre-process the data to lookup tables
-        so entities can quickly look up their data.
-        """
-        try:
-                # Grab active context variables to limit data required to be fetched from API
-                # Note: using context is not required if there is no need or ability to limit
-                # data retrieved from API.
-                listening_idx = set(self.async_contexts())
-                _LOGGER.info("idx_info: "+str(listening_idx))
-
-                result : dict = {}
-                for elm in listening_idx:
-                    # Note: asyncio.TimeoutError and aiohttp.ClientError are already
-                    # handled by the data update coordinator.
-                    async with async_timeout.timeout(REQUEST_FOR_STATUS_HEALTH):
-                        result[elm] = await self.hass.async_add_executor_job(self.my_api.getHealthStatus, elm )
-
-                return result
-
-        except InvalidCredentialsError as err:
-            # Raising ConfigEntryAuthFailed will cancel future updates
-            # and start a config flow with SOURCE_REAUTH (async_step_reauth)
-            raise ConfigEntryAuthFailed from err
-
-        except (RuntimeError, asyncio.TimeoutError) as err:
-            _LOGGER.error(msg="Timeout update Sensor General Health sensor")
-            raise UpdateFailed(f"Timeout update Sensor General Health sensor: {err}")
-
-
-
-        except Exception as err:
-            raise UpdateFailed(f"Error communicating with API: {err}")
-
-
-
-
-
 class HealthStatusBinarySensor(CoordinatorEntity,BinarySensorEntity):
     """The iDrac's current power sensor entity."""
 
-    def __init__(self, coordinator: DataUpdateCoordinator, idx, device_info: DeviceInfo, infoSingleSystem : dict) ->None:
+    def __init__(self, coordinator: DataUpdateCoordinator, idx : SensorKey, device_info: DeviceInfo, infoSingleSystem : dict) ->None:
         super().__init__(coordinator, context=idx)
         self.idx = idx
 
@@ -109,20 +38,25 @@ class HealthStatusBinarySensor(CoordinatorEntity,BinarySensorEntity):
         """Name of the entity."""
         return self.entity_description.name
 
+    async def async_added_to_hass(self) -> None:
+        """Take the current value of the shared coordinator when added."""
+        await super().async_added_to_hass()
+        self._handle_coordinator_update()
+
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
-        _LOGGER.info("coordinator data Health: "+str(self.coordinator.data))
-
         value = self.coordinator.data
+        if value is not None:
+            value = self.coordinator.data.get(self.idx.system, {})
 
 
-        if (value is None) or (value.get(self.idx,{}).get("health") == 'None'):
+        if (value is None) or (value.get(HEALTH,{}).get("health") == 'None'):
             self._attr_is_on = True
 
         else:
 
-            if value.get(self.idx,{}).get("health") == 'OK':
+            if value.get(HEALTH,{}).get("health") == 'OK':
                 self._attr_is_on = False
             else:
                 self._attr_is_on = True
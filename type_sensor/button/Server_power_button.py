@@ -5,14 +5,17 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.device_registry import DeviceInfo
 
 
+from ...api_manager import ApiRequestManager
+from ...const import PRIORITY_CRITICAL
 from ...RedfishApi import RedfishApihub
 
 class ServerPowerButton(ButtonEntity):
 
-    def __init__(self, hass: HomeAssistant, api: RedfishApihub, device_info : DeviceInfo, infoSingleSystem : dict ) -> None:
+    def __init__(self, hass: HomeAssistant, api: RedfishApihub, api_manager: ApiRequestManager, device_info : DeviceInfo, infoSingleSystem : dict ) -> None:
         super().__init__()
         self.hass = hass
         self.api = api
+        self.api_manager = api_manager
 
         self.entity_description = ButtonEntityDescription(
             key='Power Actions '+infoSingleSystem['powerActions'],
@@ -31,4 +34,5 @@ class ServerPowerButton(ButtonEntity):
 
 
     async def async_press(self) -> None:
-        await self.hass.async_add_executor_job(self.api.pressPowerStatusButton,self.id,self.powerActions)
\ No newline at end of file
+        # a reset that timed out may still have been applied: never send it twice
+        await self.api_manager.request(self.api.pressPowerStatusButton, self.id, self.powerActions, priority=PRIORITY_CRITICAL, retries=1)
\ No newline at end of file
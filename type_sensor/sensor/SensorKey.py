@@ -0,0 +1,15 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True, slots=True)
+class SensorKey:
+    """Coordinator context of an entity: sensor type, Redfish resource id and embedded system."""
+
+    type: str
+    id: str
+    system: str = ""
+
+    @property
+    def legacy_id(self) -> str:
+        """The str(dict) form contexts used to have, kept so unique ids do not change."""
+        return str({"type": self.type, "id": self.id})
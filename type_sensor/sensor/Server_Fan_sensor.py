@@ -10,6 +10,7 @@ from homeassistant.helpers.update_coordinator import CoordinatorEntity, DataUpda
 #local import
 
 from ...const import FANS
+from .SensorKey import SensorKey
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -17,13 +18,13 @@ _LOGGER = logging.getLogger(__name__)
 class FanSensor(CoordinatorEntity,SensorEntity):
     """The iDrac's current Fan sensor entity."""
 
-    def __init__(self, coordinator: DataUpdateCoordinator, idx : dict, device_info: DeviceInfo, infoSingleSystem : dict) ->None:
+    def __init__(self, coordinator: DataUpdateCoordinator, idx : SensorKey, device_info: DeviceInfo, infoSingleSystem : dict) ->None:
 
         super().__init__(coordinator, context=idx)
 
-        self.idx = eval(idx)
+        self.idx = idx
 
-        getNFan = self.idx.get("id").split(".")
+        getNFan = self.idx.id.split(".")
         getNFan = getNFan[len(getNFan)-1]
 
 
@@ -38,7 +39,7 @@ class FanSensor(CoordinatorEntity,SensorEntity):
         self.id_fan = idx
 
         self._attr_device_info = device_info
-        self._attr_unique_id = infoSingleSystem['ServiceTag']+"_"+infoSingleSystem['id']+"_"+idx
+        self._attr_unique_id = infoSingleSystem['ServiceTag']+"_"+infoSingleSystem['id']+"_"+idx.legacy_id
         self._attr_has_entity_name = True
 
         #coordinator._schedule_refresh()
@@ -49,13 +50,23 @@ class FanSensor(CoordinatorEntity,SensorEntity):
         """Name of the entity."""
         return self.entity_description.name
 
+    @property
+    def available(self) -> bool:
+        """Return if entity is available (Redfish hides the sensor while the host is off)."""
+        return super().available and self.coordinator.host_on(self.idx.system)
+
+    async def async_added_to_hass(self) -> None:
+        """Take the current value of the shared coordinator when added."""
+        await super().async_added_to_hass()
+        self._handle_coordinator_update()
+
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
-        #_LOGGER.info("update the info of the fan: "+self.idx.get("id"))
+        #_LOGGER.info("update the info of the fan: "+self.idx.id)
         #_LOGGER.info("coordinator data Fans Status: "+str(self.coordinator.data))
 
-        value = self.coordinator.data.get(FANS, {}).get(self.idx.get("id"))
+        value = self.coordinator.data.get(self.idx.system, {}).get(FANS, {}).get(self.idx.id)
         if (value == 'None') or (value is None):
             self._attr_native_value = 0
         else:
@@ -11,6 +11,7 @@ from homeassistant.helpers.update_coordinator import CoordinatorEntity, DataUpda
 #local import
 
 from ...const import PSU
+from .SensorKey import SensorKey
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -18,13 +19,13 @@ _LOGGER = logging.getLogger(__name__)
 class PSUSensor(CoordinatorEntity, SensorEntity):
     """The iDrac's current PSU voltage sensor entity."""
 
-    def __init__(self, coordinator: DataUpdateCoordinator, idx : str, device_info: DeviceInfo, infoSingleSystem : dict) ->None:
+    def __init__(self, coordinator: DataUpdateCoordinator, idx : SensorKey, device_info: DeviceInfo, infoSingleSystem : dict) ->None:
 
         super().__init__(coordinator, context=idx)
 
-        self.idx = eval(idx)
+        self.idx = idx
 
-        getNPSU = self.idx.get("id").split(".")
+        getNPSU = self.idx.id.split(".")
         getNPSU = getNPSU[len(getNPSU)-1]
 
 
@@ -40,7 +41,7 @@ class PSUSensor(CoordinatorEntity, SensorEntity):
         self.id_psu = idx
 
         self._attr_device_info = device_info
-        self._attr_unique_id = infoSingleSystem['ServiceTag']+"_"+infoSingleSystem['id']+"_"+idx
+        self._attr_unique_id = infoSingleSystem['ServiceTag']+"_"+infoSingleSystem['id']+"_"+idx.legacy_id
         self._attr_has_entity_name = True
 
         # PSU attributes
@@ -60,10 +61,15 @@ class PSUSensor(CoordinatorEntity, SensorEntity):
         """Name of the entity."""
         return self.entity_description.name
 
+    async def async_added_to_hass(self) -> None:
+        """Take the current value of the shared coordinator when added."""
+        await super().async_added_to_hass()
+        self._handle_coordinator_update()
+
     @property
     def available(self) -> bool:
-        """Return if entity is available."""
-        return self._voltage is not None
+        """Return if entity is available (Redfish hides the sensor while the host is off)."""
+        return super().available and self.coordinator.host_on(self.idx.system) and self._voltage is not None
 
     @property
     def extra_state_attributes(self):
@@ -88,10 +94,10 @@ class PSUSensor(CoordinatorEntity, SensorEntity):
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
-        #_LOGGER.info("update the info of the PSU: "+self.idx.get("id"))
+        #_LOGGER.info("update the info of the PSU: "+self.idx.id)
         #_LOGGER.info("coordinator data PSU Status: "+str(self.coordinator.data))
 
-        psu_data = self.coordinator.data.get(PSU, {}).get(self.idx.get("id"))
+        psu_data = self.coordinator.data.get(self.idx.system, {}).get(PSU, {}).get(self.idx.id)
 
         if psu_data is None or not isinstance(psu_data, dict):
             self._voltage = None
@@ -10,6 +10,7 @@ from homeassistant.helpers.update_coordinator import CoordinatorEntity, DataUpda
 #local impor
 
 from ...const import WATTSENSOR
+from .SensorKey import SensorKey
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -17,14 +18,14 @@ _LOGGER = logging.getLogger(__name__)
 class ElectricitySensor(CoordinatorEntity,SensorEntity):
     """The iDrac's current power sensor entity."""
 
-    def __init__(self, coordinator: DataUpdateCoordinator, idx : str, device_info: DeviceInfo, infoSingleSystem : dict) ->None:
+    def __init__(self, coordinator: DataUpdateCoordinator, idx : SensorKey, device_info: DeviceInfo, infoSingleSystem : dict) ->None:
         super().__init__(coordinator, context=idx)
 
-        self.idx = eval(idx)
+        self.idx = idx
 
 
         self.entity_description = SensorEntityDescription(
-            key=self.idx.get("type")+""+self.idx.get("id"),
+            key=self.idx.type+""+self.idx.id,
             name="PowerConsumedWatts",
             icon='mdi:lightning-bolt',
             native_unit_of_measurement='W',
@@ -34,7 +35,7 @@ class ElectricitySensor(CoordinatorEntity,SensorEntity):
 
 
         self._attr_device_info = device_info
-        self._attr_unique_id = infoSingleSystem['ServiceTag']+"_"+infoSingleSystem['id']+"_"+self.idx.get("id")
+        self._attr_unique_id = infoSingleSystem['ServiceTag']+"_"+infoSingleSystem['id']+"_"+self.idx.id
         self._attr_has_entity_name = True
 
         #coordinator._schedule_refresh()
@@ -45,13 +46,23 @@ class ElectricitySensor(CoordinatorEntity,SensorEntity):
         """Name of the entity."""
         return self.entity_description.name
 
+    @property
+    def available(self) -> bool:
+        """Return if entity is available (Redfish hides the sensor while the host is off)."""
+        return super().available and self.coordinator.host_on(self.idx.system)
+
+    async def async_added_to_hass(self) -> None:
+        """Take the current value of the shared coordinator when added."""
+        await super().async_added_to_hass()
+        self._handle_coordinator_update()
+
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
-        #_LOGGER.info("update the info of the power: "+self.idx.get("id"))
+        #_LOGGER.info("update the info of the power: "+self.idx.id)
         #_LOGGER.info("get the info of coordinator: "+str(self.coordinator.data))
 
-        value = self.coordinator.data.get(WATTSENSOR, {} ).get( self.idx.get("id") )
+        value = self.coordinator.data.get(self.idx.system, {}).get(WATTSENSOR, {} ).get( self.idx.id )
         if (value == 'None') or (value is None):
             self._attr_native_value = 0
         else:
@@ -12,6 +12,7 @@ from homeassistant.helpers.update_coordinator import CoordinatorEntity, DataUpda
 #local import
 
 from ...const import FANS, REQUEST_SENSOR, TEMPERATURE, WATTSENSOR
+from .SensorKey import SensorKey
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -19,15 +20,15 @@ _LOGGER = logging.getLogger(__name__)
 class TemperatureSensor(CoordinatorEntity,SensorEntity):
     """The iDrac's current power sensor entity."""
 
-    def __init__(self, coordinator: DataUpdateCoordinator, idx : str, device_info: DeviceInfo, infoSingleSystem : dict) ->None:
+    def __init__(self, coordinator: DataUpdateCoordinator, idx : SensorKey, device_info: DeviceInfo, infoSingleSystem : dict) ->None:
         super().__init__(coordinator, context=idx)
 
-        self.idx = eval(idx)
+        self.idx = idx
 
 
         self.entity_description = SensorEntityDescription(
-            key=self.idx.get("type")+""+self.idx.get("id"),
-            name=self.idx.get("id"),
+            key=self.idx.type+""+self.idx.id,
+            name=self.idx.id,
             icon='mdi:thermometer',
             native_unit_of_measurement='°C',
             device_class = SensorDeviceClass.TEMPERATURE,
@@ -36,7 +37,7 @@ class TemperatureSensor(CoordinatorEntity,SensorEntity):
 
 
         self._attr_device_info = device_info
-        self._attr_unique_id = infoSingleSystem['ServiceTag']+"_"+infoSingleSystem['id']+"_"+self.idx.get("id")
+        self._attr_unique_id = infoSingleSystem['ServiceTag']+"_"+infoSingleSystem['id']+"_"+self.idx.id
         self._attr_has_entity_name = True
 
         #coordinator._schedule_refresh()
@@ -47,18 +48,29 @@ class TemperatureSensor(CoordinatorEntity,SensorEntity):
         """Name of the entity."""
         return self.entity_description.name
 
+    @property
+    def available(self) -> bool:
+        """Return if entity is available (Redfish hides the sensor while the host is off)."""
+        return super().available and self.coordinator.host_on(self.idx.system)
+
+    async def async_added_to_hass(self) -> None:
+        """Take the current value of the shared coordinator when added."""
+        await super().async_added_to_hass()
+        self._handle_coordinator_update()
+
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
 
-        #_LOGGER.info("update the info of the power: "+self.idx.get("id"))
+        #_LOGGER.info("update the info of the power: "+self.idx.id)
 
-        value = self.coordinator.data.get(TEMPERATURE, {} ).get( self.idx.get("id") )
+        value = self.coordinator.data.get(self.idx.system, {}).get(TEMPERATURE, {} ).get( self.idx.id )
 
         if (value == 'None') or (value is None):
             #self._attr_native_value = 0
             self._attr_available = False
         else:
+            self._attr_available = True
             self._attr_native_value = value
 
 